@@ -3,6 +3,8 @@ Sample code for testing PR review.
 This file contains intentional issues for the AI to find.
 """
 
+from collections import Counter
+
 def calculate_average(numbers):
     # BUG: No check for empty list
     return sum(numbers) / len(numbers)
@@ -12,13 +14,10 @@ def process_user_input(user_input):
     exec(user_input)  # Dangerous!
     
 def slow_function(data):
-    # PERFORMANCE: Inefficient nested loops
-    result = []
-    for i in data:
-        for j in data:
-            if i == j:
-                result.append(i)
-    return result
+    # Each element is emitted once per equal element in data (same output
+    # as the old nested loop), using one Counter pass instead of O(n^2) compares
+    counts = Counter(data)
+    return [i for i in data for _ in range(counts[i])]
 
 # Add a sample function to demonstrate the AI review
 def sample_function():
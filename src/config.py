@@ -0,0 +1,101 @@
+"""
+Configuration - Single Responsibility Principle.
+Environment variables are read, converted and validated once per process.
+"""
+
+import functools
+import os
+from dataclasses import dataclass, field
+from typing import Optional
+
+
+# Version of the review prompt and response schema. Part of the review cache
+# key: bump it whenever the instructions or schema in azure_openai_provider
+# change, so reviews produced by the old prompt are not served again.
+REVIEW_PROMPT_VERSION = "pr-review-v2"
+
+
+@dataclass(frozen=True, slots=True)
+class Config:
+    """
+    Application configuration read from environment variables.
+    
+    SOLID: Single Responsibility - only holds configuration values
+    Immutable: Shared by every provider and service instance
+    """
+    # Azure OpenAI connection (from repository secrets)
+    azure_openai_endpoint: Optional[str]
+    azure_openai_api_key: Optional[str] = field(repr=False)
+    azure_openai_deployment_name: str
+    # Sent as prompt_cache_key when set; needs an API version that defines it
+    prompt_cache_key: Optional[str]
+    
+    # AI model parameters (from action inputs)
+    max_tokens: int
+    temperature: float
+    max_retries: int
+    
+    # Review limits
+    max_files: int
+    max_patch_tokens: int
+    max_concurrency: int
+    max_review_changes: int
+    min_review_changes: int
+    
+    # Review cache directory, None when caching is disabled
+    review_cache_dir: Optional[str]
+
+
+# Lower bounds checked by get_config(); max_retries may be 0 (no retries)
+_MINIMUMS = {
+    "max_concurrency": 1,
+    "max_files": 1,
+    "max_patch_tokens": 1,
+    "max_retries": 0
+}
+
+
+@functools.cache
+def get_config() -> Config:
+    """
+    Get the application configuration.
+    
+    The environment is read on the first call only; invalid numeric values
+    raise ValueError there rather than on every provider/service construction.
+    
+    Returns:
+        Config instance shared by all callers
+        
+    Raises:
+        ValueError: If a numeric value doesn't parse or is out of range
+    """
+    env = os.environ
+    
+    review_cache_dir = env.get("PR_REVIEW_CACHE_DIR")
+    if not review_cache_dir and env.get("RUNNER_TOOL_CACHE"):
+        review_cache_dir = os.path.join(env["RUNNER_TOOL_CACHE"], "pr-review-cache")
+    
+    config = Config(
+        azure_openai_endpoint=env.get("AZURE_OPENAI_ENDPOINT"),
+        azure_openai_api_key=env.get("AZURE_OPENAI_API_KEY"),
+        azure_openai_deployment_name=env.get("AZURE_OPENAI_DEPLOYMENT_NAME", "gpt-4"),
+        prompt_cache_key=env.get("AZURE_OPENAI_PROMPT_CACHE_KEY") or None,
+        max_tokens=int(env.get("MAX_TOKENS", "1500")),
+        temperature=float(env.get("TEMPERATURE", "0.1")),
+        max_retries=int(env.get("MAX_RETRIES", "3")),
+        max_files=int(env.get("MAX_FILES", "10")),
+        max_patch_tokens=int(env.get("MAX_PATCH_TOKENS", "300")),
+        max_concurrency=int(env.get("PR_REVIEW_CONCURRENCY", "8")),
+        max_review_changes=int(env.get("MAX_REVIEW_CHANGES", "5000")),
+        min_review_changes=int(env.get("MIN_REVIEW_CHANGES", "0")),
+        review_cache_dir=review_cache_dir or None
+    )
+    
+    # Zero would stall every request on the limiter (concurrency) or review
+    # nothing (files, patch tokens); negatives fail deep inside the provider
+    for name, minimum in _MINIMUMS.items():
+        value = getattr(config, name)
+        if value < minimum:
+            raise ValueError(f"{name} must be at least {minimum}, got {value}")
+    
+    return config
@@ -3,6 +3,7 @@ AI Provider Interface - Dependency Inversion Principle.
 Abstract interface that high-level modules depend on.
 """
 
+import asyncio
 from abc import ABC, abstractmethod
 from typing import Dict, Any, TYPE_CHECKING
 
@@ -41,6 +42,28 @@ class AIProvider(ABC):
             AIProviderError: When analysis fails
         """
         pass
+    
+    def analyze_pull_request_sync(
+        self,
+        pr_data: "PullRequestData",
+        config: Dict[str, Any]
+    ) -> "ReviewResult":
+        """
+        Blocking variant of analyze_pull_request.
+        
+        The default runs the async implementation in a new event loop;
+        providers with a native blocking client should override it.
+        """
+        return asyncio.run(self.analyze_pull_request(pr_data, config))
+    
+    async def aclose(self) -> None:
+        """Release network resources held by the provider (no-op by default)."""
+    
+    async def __aenter__(self) -> "AIProvider":
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.aclose()
 
 
 class AIProviderError(Exception):
@@ -33,10 +33,21 @@ AZURE OPENAI CONFIGURATION (from repository secrets):
 • AZURE_OPENAI_ENDPOINT: Azure OpenAI service endpoint URL
 • AZURE_OPENAI_API_KEY: Authentication key for Azure OpenAI API
 • AZURE_OPENAI_DEPLOYMENT_NAME: Model deployment name (e.g., "gpt-4")
+• AZURE_OPENAI_PROMPT_CACHE_KEY: Optional prompt_cache_key sent with every request
+  (action input prompt_cache_key; unset by default, only for API versions
+  that accept the parameter)
 
 AI MODEL PARAMETERS (from action inputs):
 • MAX_TOKENS: Maximum response length (default: 1500)
 • TEMPERATURE: AI creativity setting 0.0-1.0 (default: 0.1)
+• MAX_RETRIES: Retries per request on transient errors (default: 3)
+
+REVIEW LIMITS (from action inputs):
+• MAX_FILES: Files reviewed per PR; PRs with more are not approved (default: 10)
+• MAX_PATCH_TOKENS: Tokens of each file diff included in the prompt (default: 300)
+• PR_REVIEW_CONCURRENCY: Maximum concurrent Azure OpenAI requests (input concurrency, default: 8)
+• MAX_REVIEW_CHANGES: Skip the AI review for PRs changing more lines than this (default: 5000)
+• MIN_REVIEW_CHANGES: Auto-approve PRs changing fewer lines than this (default: 0, disabled)
 
 GITHUB CONTEXT (automatically provided by GitHub Actions):
 • GITHUB_EVENT_PATH: Path to webhook event payload JSON
@@ -47,6 +58,9 @@ GITHUB CONTEXT (automatically provided by GitHub Actions):
 • GITHUB_REF: Git ref (branch/tag) being built
 • GITHUB_OUTPUT: File path for setting action outputs
 
+REVIEW CACHE (optional):
+• PR_REVIEW_CACHE_DIR: Directory for cached review results (default: $RUNNER_TOOL_CACHE/pr-review-cache)
+
 EXECUTION PHASES:
 ================
 1. INITIALIZATION: Set up logging, read environment variables
@@ -60,18 +74,52 @@ Demonstrates SOLID principles and clean architecture.
 """
 
 import asyncio
-import json
+import io
+import logging
 import os
 import sys
-from datetime import datetime
-from typing import List
+import tempfile
+import uuid
+from typing import Optional
 
-from .providers.azure_openai_provider import AzureOpenAIProvider
-from .services.pr_review_service import PRReviewService
+import orjson
+
+from .config import REVIEW_PROMPT_VERSION, get_config
 from .models.pr_data import PullRequestData, FileChange
+from .models.review_result import ReviewResult, ReviewSeverity
+from .services.pr_review_service import PRReviewService, is_trivial_change, trivial_review_result
 from .utils.logger import get_logger
 
 
+logger = get_logger(__name__)
+
+# Emoji shown next to each review comment, keyed by severity
+_SEVERITY_EMOJI = {
+    ReviewSeverity.INFO: "ℹ️",
+    ReviewSeverity.WARNING: "⚠️",
+    ReviewSeverity.ERROR: "❌",
+}
+
+# Sample file changes used by _get_pr_data_from_github for demonstration;
+# built once at import since FileChange is immutable
+_SAMPLE_FILES = (
+    FileChange(
+        filename="src/main.py",
+        status="modified",
+        additions=15,
+        deletions=3,
+        patch="@@ -10,7 +10,19 @@ def main():\\n+    # Added error handling\\n+    try:\\n+        result = process()\\n+    except Exception as e:\\n+        logger.error(f'Error: {e}')\\n+        return 1"
+    ),
+    FileChange(
+        filename="README.md",
+        status="modified",
+        additions=5,
+        deletions=1,
+        patch="@@ -1,4 +1,8 @@ # Project\\n+\\n+## New Section\\n+\\nAdded documentation for new features."
+    )
+)
+
+
 async def main():
     """
     Main function - orchestrates the review process.
@@ -126,8 +174,6 @@ async def main():
     - Error handling and logging
     - Clean separation of concerns
     """
-    logger = get_logger(__name__)
-    
     try:
         logger.info("Starting Azure OpenAI PR Review Agent")
         logger.info("Environment: GitHub Actions Docker Container")
@@ -140,8 +186,27 @@ async def main():
         # from the GitHub Actions context (GITHUB_EVENT_PATH, GITHUB_TOKEN, etc.)
         logger.info("Phase 1: Extracting PR data from GitHub Actions environment")
         pr_data = _get_pr_data_from_github()
-        logger.info(f"Extracted PR #{pr_data.number}: '{pr_data.title}' by {pr_data.author}")
-        logger.info(f"Files changed: {len(pr_data.files_changed)}, Total changes: {pr_data.get_total_changes()} lines")
+        logger.info("Extracted PR #%s: '%s' by %s", pr_data.number, pr_data.title, pr_data.author)
+        logger.info("Files changed: %d, Total changes: %d lines", len(pr_data.files_changed), pr_data.get_total_changes())
+        
+        # Some PRs can't be usefully reviewed by the AI (no changes, docs
+        # only, oversized diffs) - answer those without an API call
+        skip_result = _pre_review_result(pr_data)
+        if skip_result is not None:
+            logger.info("Skipping AI review: %s", skip_result.summary)
+            _output_results(skip_result)
+            return
+        
+        # Reuse a previous review of the exact same diff (workflow re-runs,
+        # synchronize events that don't change the patches) instead of
+        # paying for another Azure OpenAI round-trip
+        cache_key = _review_cache_key(pr_data)
+        cached_result = _load_cached_review(cache_key)
+        if cached_result is not None:
+            logger.info("Review cache hit (%.12s) - skipping AI analysis", cache_key)
+            _output_results(cached_result)
+            logger.info("Review completed successfully from cache")
+            return
         
         # ===================================================================
         # PHASE 2: INITIALIZE AI PROVIDER WITH DEPENDENCY INJECTION
@@ -150,27 +215,36 @@ async def main():
         # The provider reads Azure OpenAI credentials from environment variables
         # set by the GitHub Actions workflow from repository secrets
         logger.info("Phase 2: Initializing Azure OpenAI provider")
-        ai_provider = AzureOpenAIProvider()
-        logger.info("Azure OpenAI provider initialized successfully")
-        
-        # ===================================================================
-        # PHASE 3: CREATE REVIEW SERVICE WITH INJECTED DEPENDENCIES
-        # ===================================================================
-        # Initialize review service with injected AI provider
-        # This demonstrates SOLID's Dependency Inversion Principle
-        logger.info("Phase 3: Creating PR review service")
-        review_service = PRReviewService(ai_provider)
-        logger.info("Review service created with dependency injection")
-        
-        # ===================================================================
-        # PHASE 4: PERFORM AI-POWERED ANALYSIS
-        # ===================================================================
-        # Perform review - this calls Azure OpenAI API to analyze the PR
-        logger.info("Phase 4: Starting AI-powered PR analysis")
-        result = await review_service.review_pull_request(pr_data)
-        logger.info(f"AI analysis completed - Score: {result.overall_score}/10, Approved: {result.approved}")
-        logger.info(f"Generated {len(result.comments)} specific comments")
+        # Imported here so the openai SDK and its dependencies are only loaded
+        # when an AI call is actually needed - cache hits never pay for them
+        from .providers.azure_openai_provider import AzureOpenAIProvider
         
+        # The provider is used as an async context manager so its HTTP
+        # connection pool is shared by all requests and closed cleanly
+        async with AzureOpenAIProvider() as ai_provider:
+            logger.info("Azure OpenAI provider initialized successfully")
+            
+            # ===================================================================
+            # PHASE 3: CREATE REVIEW SERVICE WITH INJECTED DEPENDENCIES
+            # ===================================================================
+            # Initialize review service with injected AI provider
+            # This demonstrates SOLID's Dependency Inversion Principle
+            logger.info("Phase 3: Creating PR review service")
+            review_service = PRReviewService(ai_provider)
+            logger.info("Review service created with dependency injection")
+            
+            # ===================================================================
+            # PHASE 4: PERFORM AI-POWERED ANALYSIS
+            # ===================================================================
+            # Perform review - this calls Azure OpenAI API to analyze the PR
+            logger.info("Phase 4: Starting AI-powered PR analysis")
+            result = await review_service.review_pull_request(pr_data)
+            logger.info("AI analysis completed - Score: %s/10, Approved: %s", result.overall_score, result.approved)
+            logger.info("Generated %d specific comments", len(result.comments))
+            # Partial results (some files failed) must be retried next run
+            if not result.partial:
+                _store_cached_review(cache_key, result)
+            
         # ===================================================================
         # PHASE 5: OUTPUT RESULTS FOR GITHUB ACTIONS CONSUMPTION
         # ===================================================================
@@ -184,8 +258,8 @@ async def main():
         
     except Exception as e:
         # Comprehensive error logging for debugging
-        logger.error(f"Review failed in main orchestration: {e}")
-        logger.error(f"Error type: {type(e).__name__}")
+        logger.error("Review failed in main orchestration: %s", e)
+        logger.error("Error type: %s", type(e).__name__)
         logger.error("Check Azure OpenAI credentials and GitHub Actions environment")
         
         # Exit with error code to signal failure to GitHub Actions
@@ -228,35 +302,60 @@ def _get_pr_data_from_github() -> PullRequestData:
     # - GITHUB_REPOSITORY
     # - GITHUB_EVENT_PATH
     
-    # Sample data for demonstration
-    sample_files = [
-        FileChange(
-            filename="src/main.py",
-            status="modified",
-            additions=15,
-            deletions=3,
-            patch="@@ -10,7 +10,19 @@ def main():\\n+    # Added error handling\\n+    try:\\n+        result = process()\\n+    except Exception as e:\\n+        logger.error(f'Error: {e}')\\n+        return 1"
-        ),
-        FileChange(
-            filename="README.md",
-            status="modified",
-            additions=5,
-            deletions=1,
-            patch="@@ -1,4 +1,8 @@ # Project\\n+\\n+## New Section\\n+\\nAdded documentation for new features."
-        )
-    ]
-    
+    env = os.environ
     return PullRequestData(
-        number=int(os.getenv("GITHUB_PR_NUMBER", "123")),
-        title=os.getenv("GITHUB_PR_TITLE", "Add error handling and documentation"),
-        body=os.getenv("GITHUB_PR_BODY", "This PR adds error handling to the main function and updates documentation."),
-        author=os.getenv("GITHUB_ACTOR", "developer"),
+        number=int(env.get("GITHUB_PR_NUMBER", "123")),
+        title=env.get("GITHUB_PR_TITLE", "Add error handling and documentation"),
+        body=env.get("GITHUB_PR_BODY", "This PR adds error handling to the main function and updates documentation."),
+        author=env.get("GITHUB_ACTOR", "developer"),
         base_branch="main",
         head_branch="feature/error-handling",
-        files_changed=sample_files
+        files_changed=_SAMPLE_FILES
     )
 
 
+def _pre_review_result(pr_data: PullRequestData) -> Optional[ReviewResult]:
+    """
+    Return a review for PRs that don't need the AI, or None to run the review.
+    
+    Covers PRs with no line changes, trivial PRs (documentation or minified
+    bundles only, or fewer than MIN_REVIEW_CHANGES lines) and diffs larger
+    than MAX_REVIEW_CHANGES, which would only time out or be truncated.
+    Oversized diffs are never approved, since nothing in them was reviewed.
+    
+    Only file names and line counts are checked, so these PRs need neither
+    Azure credentials nor a provider.
+    """
+    total_changes = pr_data.get_total_changes()
+    
+    if not pr_data.files_changed or total_changes == 0:
+        return ReviewResult(
+            summary="No code changes detected",
+            comments=[],
+            overall_score=10,
+            approved=True
+        )
+    
+    config = get_config()
+    if is_trivial_change(pr_data, config.min_review_changes):
+        return trivial_review_result()
+    
+    max_changes = config.max_review_changes
+    if total_changes > max_changes:
+        return ReviewResult(
+            summary=(
+                f"Diff too large ({total_changes} lines changed, limit {max_changes}), "
+                "AI review skipped - manual review required"
+            ),
+            comments=[],
+            overall_score=5,
+            # Nothing was reviewed, so this must not read as an approval
+            approved=False
+        )
+    
+    return None
+
+
 def _output_results(result):
     """
     Output review results for GitHub Actions consumption.
@@ -290,96 +389,163 @@ def _output_results(result):
     Args:
         result: ReviewResult to output
     """
-    logger = get_logger(__name__)
+    # Create JSON result for detailed workflow consumption
+    # This contains the complete review data in structured format and is
+    # built once - the individual outputs below reuse it
+    result_json = result.to_dict()
     
     # Create GitHub Actions outputs for workflow consumption
     # These individual outputs can be referenced in subsequent workflow steps
     outputs = {
-        "summary": result.summary,           # Brief review summary
-        "score": result.overall_score,       # Numeric score (1-10)
-        "approved": result.approved,         # Boolean approval status
-        "comment_count": len(result.comments) # Number of specific comments
-    }
-    
-    # Create JSON result for detailed workflow consumption
-    # This contains the complete review data in structured format
-    result_json = {
-        "summary": result.summary,
-        "overall_score": result.overall_score,
-        "approved": result.approved,
-        "comments": [
-            {
-                "filename": c.filename,
-                "line_number": c.line_number,
-                "message": c.message,
-                "severity": c.severity.value
-            }
-            for c in result.comments
-        ]
+        "summary": result_json["summary"],                # Brief review summary
+        "score": result_json["overall_score"],            # Numeric score (1-10)
+        "approved": result_json["approved"],              # Boolean approval status
+        "comment_count": len(result_json["comments"])     # Number of specific comments
     }
     
     # Set GitHub Actions outputs using the modern method
     # This writes to the $GITHUB_OUTPUT file that GitHub Actions reads
+    # Individual outputs for easy access in workflow, followed by the complete
+    # JSON result for complex processing - assembled once as bytes (orjson
+    # emits compact UTF-8 directly) and written in a single call
+    payload = "".join(_format_output(key, value) for key, value in outputs.items()).encode()
+    payload += b"review_result=" + orjson.dumps(result_json) + b"\n"
+    
     github_output = os.getenv("GITHUB_OUTPUT")
     if github_output:
-        with open(github_output, "a") as f:
-            # Write individual outputs for easy access in workflow
-            for key, value in outputs.items():
-                f.write(f"{key}={value}\n")
-            # Write complete JSON result for complex processing
-            f.write(f"review_result={json.dumps(result_json)}\n")
+        # The payload is already bytes, so skip the buffered io stack and
+        # append with a single write(2) on a raw file descriptor
+        fd = os.open(github_output, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        try:
+            os.write(fd, payload)
+        finally:
+            os.close(fd)
     else:
         # Fallback for local testing when $GITHUB_OUTPUT is not available
-        for key, value in outputs.items():
-            print(f"{key}={value}")
-        print(f"review_result={json.dumps(result_json)}")
+        print(payload.decode(), end="")
     
     # Create formatted review comment for debugging/logging
-    # This shows what the final PR comment will look like
-    comment_body = _format_review_comment(result)
+    # This shows what the final PR comment will look like; skipped entirely
+    # when INFO logging is disabled
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("Review comment:")
+        logger.info(_format_review_comment(result))
+
+
+def _format_output(key: str, value) -> str:
+    """
+    Format one $GITHUB_OUTPUT entry.
+    
+    "key=value" only works for single-line values; anything containing a
+    newline (e.g. a model-written summary) uses the multi-line
+    "key<<DELIMITER" syntax with a delimiter that can't occur in the value.
+    """
+    value = str(value)
+    if "\n" not in value and "\r" not in value:
+        return f"{key}={value}\n"
     
-    # Log the review comment
-    logger.info("Review comment:")
-    logger.info(comment_body)
+    delimiter = f"ghadelimiter_{uuid.uuid4()}"
+    return f"{key}<<{delimiter}\n{value}\n{delimiter}\n"
+
+
+def _review_cache_key(pr_data: PullRequestData) -> str:
+    """
+    Key of the cached review for a PR.
+    
+    Besides the PR content, a review depends on the model deployment, the
+    prompt, how much of the PR the prompt includes (MAX_FILES,
+    MAX_PATCH_TOKENS) and the sampling settings, so all of them are part of
+    the key: changing any of them never serves a review restored from an
+    older cache.
+    """
+    config = get_config()
+    return pr_data.get_content_hash(
+        config.azure_openai_deployment_name,
+        REVIEW_PROMPT_VERSION,
+        str(config.max_files),
+        str(config.max_patch_tokens),
+        str(config.max_tokens),
+        str(config.temperature)
+    )
+
+
+def _load_cached_review(key: str) -> Optional[ReviewResult]:
+    """Return the cached review for key, or None on a miss or unreadable entry."""
+    cache_dir = get_config().review_cache_dir
+    if not cache_dir:
+        return None
+    
+    path = os.path.join(cache_dir, f"{key}.json")
+    try:
+        with open(path, "rb") as f:
+            return ReviewResult.from_dict(orjson.loads(f.read()))
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError, KeyError) as e:
+        logger.warning("Ignoring unreadable review cache entry %s: %s", path, e)
+        return None
+
+
+def _store_cached_review(key: str, result: ReviewResult) -> None:
+    """
+    Persist a review result in the cache.
+    
+    The file is written to a temporary name and renamed into place so a
+    concurrent reader never sees a partial entry. Failures are logged and
+    never fail the review itself.
+    
+    Entries are made world-readable: the action runs as root in Docker, but
+    the actions/cache post step that saves the directory runs as the runner
+    user and can't read mkstemp's default 0600 files.
+    """
+    cache_dir = get_config().review_cache_dir
+    if not cache_dir:
+        return
+    
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                os.fchmod(f.fileno(), 0o644)
+                f.write(orjson.dumps(result.to_dict()))
+            os.replace(tmp_path, os.path.join(cache_dir, f"{key}.json"))
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    except OSError as e:
+        logger.warning("Could not write review cache entry: %s", e)
 
 
 def _format_review_comment(result) -> str:
     """Format review result as GitHub comment."""
-    lines = [
-        "## 🤖 AI Code Review",
-        "",
-        f"**Overall Score:** {result.overall_score}/10",
-        f"**Status:** {'✅ Approved' if result.approved else '❌ Changes Requested'}",
-        "",
-        "### Summary",
-        result.summary,
-        ""
-    ]
+    buf = io.StringIO()
+    w = buf.write
+    
+    w("## 🤖 AI Code Review\n\n")
+    w(f"**Overall Score:** {result.overall_score}/10\n")
+    w(f"**Status:** {'✅ Approved' if result.approved else '❌ Changes Requested'}\n\n")
+    w(f"### Summary\n{result.summary}\n\n")
     
     if result.comments:
-        lines.extend([
-            "### Comments",
-            ""
-        ])
+        w("### Comments\n\n")
         
         for comment in result.comments:
-            emoji = {"info": "ℹ️", "warning": "⚠️", "error": "❌"}
-            severity_emoji = emoji.get(comment.severity.value, "ℹ️")
+            severity_emoji = _SEVERITY_EMOJI[comment.severity]
             
             if comment.filename and comment.line_number:
-                lines.append(f"{severity_emoji} **{comment.filename}:{comment.line_number}**")
+                w(f"{severity_emoji} **{comment.filename}:{comment.line_number}**\n")
             elif comment.filename:
-                lines.append(f"{severity_emoji} **{comment.filename}**")
+                w(f"{severity_emoji} **{comment.filename}**\n")
             else:
-                lines.append(f"{severity_emoji} **General**")
+                w(f"{severity_emoji} **General**\n")
             
-            lines.append(f"  {comment.message}")
-            lines.append("")
+            w(f"  {comment.message}\n\n")
     
-    lines.append("---")
-    lines.append("*Generated by Azure OpenAI PR Review Agent*")
+    w("---\n")
+    w("*Generated by Azure OpenAI PR Review Agent*")
     
-    return "\\n".join(lines)
+    return buf.getvalue()
 
 
 if __name__ == "__main__":
@@ -3,11 +3,13 @@ Pull Request Data Model - Single Responsibility Principle.
 Immutable data structure for PR information.
 """
 
-from dataclasses import dataclass
-from typing import List, Optional
+import hashlib
+import os
+from dataclasses import dataclass, field
+from typing import List, Optional, Tuple
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True, eq=False)
 class FileChange:
     """
     Represents a single file change.
@@ -21,13 +23,15 @@ class FileChange:
     patch: Optional[str] = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True, eq=False)
 class PullRequestData:
     """
     Pull request data structure.
     
     SOLID: Single Responsibility - aggregates PR information
     Immutable: Prevents accidental modifications (frozen=True)
+    Lightweight: slots=True drops the per-instance __dict__; eq=False since
+    PRs are never compared by value
     """
     number: int
     title: str
@@ -35,17 +39,64 @@ class PullRequestData:
     author: str
     base_branch: str
     head_branch: str
-    files_changed: List[FileChange]
+    files_changed: Tuple[FileChange, ...]
+    
+    # Derived values, computed once in __post_init__ since the PR is immutable
+    _total_changes: int = field(init=False, repr=False, compare=False)
+    _file_extensions: Tuple[str, ...] = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self) -> None:
+        # Accept any iterable of FileChange but store an immutable tuple
+        # frozen=True blocks normal assignment
+        object.__setattr__(self, "files_changed", tuple(self.files_changed))
+        
+        # One pass over the files for both derived values. splitext only
+        # looks at the base name, so dotted directories ("docs.v2/Makefile")
+        # don't produce bogus extensions.
+        total_changes = 0
+        extensions = set()
+        for file_change in self.files_changed:
+            total_changes += file_change.additions + file_change.deletions
+            ext = os.path.splitext(file_change.filename)[1][1:]
+            if ext:
+                extensions.add(ext.lower())
+        
+        object.__setattr__(self, "_total_changes", total_changes)
+        object.__setattr__(self, "_file_extensions", tuple(sorted(extensions)))
     
     def get_total_changes(self) -> int:
         """Calculate total lines changed."""
-        return sum(fc.additions + fc.deletions for fc in self.files_changed)
+        return self._total_changes
     
     def get_file_extensions(self) -> List[str]:
         """Get unique file extensions from changed files."""
-        extensions = set()
-        for file_change in self.files_changed:
-            if '.' in file_change.filename:
-                ext = file_change.filename.split('.')[-1].lower()
-                extensions.add(ext)
-        return sorted(extensions)
+        return list(self._file_extensions)
+    
+    def get_content_hash(self, *context: str) -> str:
+        """
+        Hash of the PR content that a review depends on.
+        
+        Only the diff, title and description influence the review, so PR
+        number, author and branches are deliberately left out. Used as the
+        key for cached review results.
+        
+        Args:
+            context: Extra values the review depends on (e.g. model and
+                prompt version), mixed into the hash
+        """
+        # Patches are fed to the hash one at a time so the whole diff is never
+        # copied into a single concatenated buffer
+        digest = hashlib.blake2b(digest_size=32)
+        for value in context:
+            digest.update(value.encode())
+            digest.update(b"\0")
+        for fc in self.files_changed:
+            digest.update(fc.filename.encode())
+            digest.update(b"\0")
+            if fc.patch:
+                digest.update(fc.patch.encode())
+            digest.update(b"\0")
+        digest.update(self.title.encode())
+        digest.update(b"\0")
+        digest.update(self.body.encode())
+        return digest.hexdigest()
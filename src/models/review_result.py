@@ -3,8 +3,8 @@ Review Result Model - Single Responsibility Principle.
 Immutable data structure for review results.
 """
 
-from dataclasses import dataclass
-from typing import List, Optional
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
 from enum import Enum
 
 
@@ -15,7 +15,7 @@ class ReviewSeverity(Enum):
     ERROR = "error"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True, eq=False)
 class ReviewComment:
     """
     Individual review comment.
@@ -26,9 +26,28 @@ class ReviewComment:
     filename: Optional[str]
     message: str
     severity: ReviewSeverity = ReviewSeverity.INFO
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a JSON-serializable dict."""
+        return {
+            "filename": self.filename,
+            "line_number": self.line_number,
+            "message": self.message,
+            "severity": self.severity.value
+        }
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ReviewComment":
+        """Create a comment from the structure produced by to_dict."""
+        return cls(
+            filename=data.get("filename"),
+            line_number=data.get("line_number"),
+            message=data["message"],
+            severity=ReviewSeverity(data.get("severity", "info"))
+        )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True, eq=False)
 class ReviewResult:
     """
     Complete review result.
@@ -37,14 +56,67 @@ class ReviewResult:
     Immutable: Prevents accidental modifications
     """
     summary: str
-    comments: List[ReviewComment]
+    comments: Tuple[ReviewComment, ...]
     overall_score: int  # 1-10 scale
     approved: bool
     
+    # True when some files could not be reviewed; such results are never
+    # cached so a re-run reviews the PR again
+    partial: bool = False
+    
+    # Comments grouped by severity, computed once in __post_init__ since the
+    # result is immutable
+    _by_severity: Dict[ReviewSeverity, Tuple[ReviewComment, ...]] = field(
+        init=False, repr=False, compare=False
+    )
+    
+    def __post_init__(self) -> None:
+        # Accept any iterable of ReviewComment but store an immutable tuple,
+        # so the severity buckets below can't go stale
+        # frozen=True blocks normal assignment
+        object.__setattr__(self, "comments", tuple(self.comments))
+        
+        buckets: Dict[ReviewSeverity, List[ReviewComment]] = {
+            severity: [] for severity in ReviewSeverity
+        }
+        for comment in self.comments:
+            buckets[comment.severity].append(comment)
+        
+        object.__setattr__(
+            self,
+            "_by_severity",
+            {severity: tuple(group) for severity, group in buckets.items()}
+        )
+    
     def get_comments_by_severity(self, severity: ReviewSeverity) -> List[ReviewComment]:
         """Filter comments by severity level."""
-        return [comment for comment in self.comments if comment.severity == severity]
+        return list(self._by_severity[severity])
     
     def has_blocking_issues(self) -> bool:
         """Check if there are any error-level comments."""
-        return any(comment.severity == ReviewSeverity.ERROR for comment in self.comments)
+        return bool(self._by_severity[ReviewSeverity.ERROR])
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convert to a JSON-serializable dict.
+        
+        This is the structure published as the review_result action output.
+        """
+        return {
+            "summary": self.summary,
+            "overall_score": self.overall_score,
+            "approved": self.approved,
+            "partial": self.partial,
+            "comments": [comment.to_dict() for comment in self.comments]
+        }
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ReviewResult":
+        """Create a result from the structure produced by to_dict."""
+        return cls(
+            summary=data["summary"],
+            comments=[ReviewComment.from_dict(c) for c in data.get("comments", [])],
+            overall_score=data["overall_score"],
+            approved=data["approved"],
+            partial=data.get("partial", False)
+        )
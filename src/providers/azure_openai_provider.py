@@ -4,35 +4,237 @@ Concrete implementation of AIProvider interface.
 """
 
 import asyncio
-import json
-import os
-from typing import Dict, Any
-from openai import AsyncAzureOpenAI
+import concurrent.futures
+import dataclasses
+import functools
+import hashlib
+import threading
+from string import Template
+from typing import Callable, Dict, Any, Final, List, Optional, Sequence, Tuple, Type, TypeVar, Union
+import httpx
+import orjson
+import tiktoken
+from openai import AsyncAzureOpenAI, AzureOpenAI
+from ..config import get_config
 from ..interfaces.ai_provider import AIProvider, AIProviderError
-from ..models.pr_data import PullRequestData
+from ..models.pr_data import PullRequestData, FileChange
 from ..models.review_result import ReviewResult, ReviewComment, ReviewSeverity
 from ..utils.logger import get_logger
 
 
-class AzureOpenAIProvider(AIProvider):
+_API_VERSION = "2024-10-21"  # first GA version with structured outputs
+
+# Static review instructions, sent as the system message ahead of the
+# PR-specific data. Keeping them identical and first in every request lets
+# Azure OpenAI reuse its cached prefix instead of reprocessing them.
+# Bump config.REVIEW_PROMPT_VERSION when changing these or _REVIEW_SCHEMA.
+_REVIEW_INSTRUCTIONS = """You are a senior code reviewer. Analyze the pull request changes you are given and provide feedback.
+
+Focus on:
+- Code quality: readability, naming, structure and duplication.
+- Best practices: idiomatic use of the language and standard library, error handling and logging.
+- Potential bugs: unhandled edge cases (empty input, None, zero), incorrect conditions, off-by-one errors, resource leaks and concurrency issues.
+- Security issues: injection, eval/exec of untrusted input, hard-coded secrets, missing input validation and insecure defaults.
+- Performance: needless quadratic work, repeated I/O and blocking calls in async code.
+
+Severity levels:
+- error: must be fixed before merging (bugs, security issues, data loss).
+- warning: should be fixed (risky patterns, missing error handling, maintainability problems).
+- info: suggestions and minor improvements.
+
+Guidelines:
+- Keep comments constructive and specific; explain why something is a problem and how to fix it.
+- Reference the file and, when possible, the line number in the new version of the file (from the patch hunk headers). Use null for general comments.
+- Patches may be truncated; do not comment on code that is cut off.
+- summary is a brief overall assessment.
+- overall_score is 1-10, where 10 means ready to merge as is. Set approved to false when there is any error-level comment."""
+
+# JSON schema for the review response (structured outputs). Strict mode
+# requires every property to be listed as required; optional values are
+# expressed as nullable types instead.
+_REVIEW_SCHEMA: Dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "summary": {"type": "string"},
+        "comments": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {
+                    "filename": {"type": ["string", "null"]},
+                    "line_number": {"type": ["integer", "null"]},
+                    "message": {"type": "string"},
+                    "severity": {
+                        "type": "string",
+                        "enum": [severity.value for severity in ReviewSeverity]
+                    }
+                },
+                "required": ["filename", "line_number", "message", "severity"],
+                "additionalProperties": False
+            }
+        },
+        "overall_score": {"type": "integer"},
+        "approved": {"type": "boolean"}
+    },
+    "required": ["summary", "comments", "overall_score", "approved"],
+    "additionalProperties": False
+}
+
+# Request pieces that never change - built once instead of on every call
+_SYSTEM_MESSAGE: Final[Dict[str, str]] = {"role": "system", "content": _REVIEW_INSTRUCTIONS}
+_RESPONSE_FORMAT: Final[Dict[str, Any]] = {
+    "type": "json_schema",
+    "json_schema": {"name": "review", "schema": _REVIEW_SCHEMA, "strict": True}
+}
+
+# PR-level prompt header, parsed once; the file listing follows it
+_PR_HEADER_TEMPLATE: Final[Template] = Template(
+    "PR Title: $title\n"
+    "Description: $body\n"
+    "Author: $author\n"
+    "Files changed: $file_count\n"
+    "Total changes: $total_changes lines"
+)
+
+_ClientT = TypeVar("_ClientT", AsyncAzureOpenAI, AzureOpenAI)
+_ClientKey = Tuple[str, str, str, str]
+
+
+@dataclasses.dataclass(slots=True)
+class _SharedClient:
+    """A cached client and the number of providers currently using it."""
+    client: Union[AsyncAzureOpenAI, AzureOpenAI]
+    refs: int = 0
+
+
+# Clients shared by all provider instances, keyed by (client type, endpoint,
+# api_version, api_key digest), so each endpoint keeps one warm connection pool
+_CLIENT_CACHE: Dict[_ClientKey, _SharedClient] = {}
+
+
+@functools.lru_cache(maxsize=None)
+def _get_encoding(model: str) -> Optional[tiktoken.Encoding]:
     """
-    Azure OpenAI implementation of AIProvider.
+    Return the tokenizer for a model, loaded once per model name.
     
-    SOLID Principles Applied:
-    - Single Responsibility: Only handles Azure OpenAI interactions
-    - Open/Closed: Implements interface without modifying it
-    - Liskov Substitution: Can replace any AIProvider
-    - Dependency Inversion: Depends on AIProvider abstraction
+    tiktoken downloads tokenizer files on first use; when that fails (no
+    network, blocked blob storage) None is returned - and cached, so the
+    warning is logged once - and callers fall back to a byte-based cap.
+    """
+    try:
+        try:
+            return tiktoken.encoding_for_model(model)
+        except KeyError:
+            # Azure deployment names are user-chosen and often not model names
+            return tiktoken.get_encoding("cl100k_base")
+    except Exception as e:
+        get_logger(__name__).warning(
+            "Could not load tokenizer for %s, truncating patches by bytes: %s", model, e
+        )
+        return None
+
+
+# HTTP/2 lets concurrent completions share one TCP connection; the pool is
+# sized for the per-file fan-out and idle connections are kept for two
+# minutes instead of httpx's 5s default. Retries are left to the SDK.
+_HTTP_LIMITS = httpx.Limits(
+    max_connections=100,
+    max_keepalive_connections=20,
+    keepalive_expiry=120
+)
+_HTTP_TIMEOUT = httpx.Timeout(60.0, connect=5.0)
+
+
+def _create_http_client() -> httpx.AsyncClient:
+    """Build the HTTP client used by AsyncAzureOpenAI."""
+    transport = httpx.AsyncHTTPTransport(http2=True, retries=0, limits=_HTTP_LIMITS)
+    return httpx.AsyncClient(transport=transport, timeout=_HTTP_TIMEOUT)
+
+
+def _create_sync_http_client() -> httpx.Client:
+    """Build the HTTP client used by the blocking AzureOpenAI client."""
+    transport = httpx.HTTPTransport(http2=True, retries=0, limits=_HTTP_LIMITS)
+    return httpx.Client(transport=transport, timeout=_HTTP_TIMEOUT)
+
+
+def _acquire_client(
+    client_class: Type[_ClientT],
+    http_client_factory: Callable[[], Union[httpx.AsyncClient, httpx.Client]],
+    endpoint: str,
+    api_key: str
+) -> Tuple[_ClientKey, _ClientT]:
+    """
+    Take a reference to the shared client for these credentials.
+    
+    The client is created on first use. Every acquire must be paired with a
+    _release_client call once the caller is done with it.
+    """
+    key = (
+        client_class.__name__,
+        endpoint,
+        _API_VERSION,
+        hashlib.sha256(api_key.encode()).hexdigest()
+    )
+    shared = _CLIENT_CACHE.get(key)
+    if shared is None:
+        shared = _SharedClient(client_class(
+            azure_endpoint=endpoint,
+            api_key=api_key,
+            api_version=_API_VERSION,
+            max_retries=3,
+            http_client=http_client_factory()
+        ))
+        _CLIENT_CACHE[key] = shared
+    shared.refs += 1
+    return key, shared.client
+
+
+def _release_client(key: _ClientKey) -> Optional[Union[AsyncAzureOpenAI, AzureOpenAI]]:
+    """
+    Drop a reference taken by _acquire_client.
+    
+    Returns:
+        The client when this was its last user - it is removed from the
+        cache and the caller must close it - otherwise None
+    """
+    shared = _CLIENT_CACHE[key]
+    shared.refs -= 1
+    if shared.refs:
+        return None
+    del _CLIENT_CACHE[key]
+    return shared.client
+
+
+def _chunk_text(chunk: Any) -> str:
+    """Text carried by a streamed completion chunk, or "" for none."""
+    # Azure sends chunks without choices (e.g. prompt filter results)
+    if chunk.choices and chunk.choices[0].delta.content:
+        return chunk.choices[0].delta.content
+    return ""
+
+
+class _AzureOpenAIBase(AIProvider):
+    """
+    Azure OpenAI behaviour shared by the async and blocking providers.
+    
+    Holds the connection settings and everything that doesn't touch the
+    network: prompt building, token truncation, response parsing and
+    merging of per-file results. Subclasses own the client and the calls.
     """
     
     def __init__(self):
-        """Initialize Azure OpenAI client with environment variables."""
+        """Read the Azure OpenAI connection settings."""
         self.logger = get_logger(__name__)
         
-        # Get Azure OpenAI configuration from environment
-        self.endpoint = os.getenv("AZURE_OPENAI_ENDPOINT")
-        self.api_key = os.getenv("AZURE_OPENAI_API_KEY")
-        self.deployment_name = os.getenv("AZURE_OPENAI_DEPLOYMENT_NAME", "gpt-4")
+        # Get Azure OpenAI configuration (read from the environment once)
+        config = get_config()
+        self.endpoint = config.azure_openai_endpoint
+        self.api_key = config.azure_openai_api_key
+        self.deployment_name = config.azure_openai_deployment_name
+        self.prompt_cache_key = config.prompt_cache_key
+        # Upper bound on Azure OpenAI requests in flight through this
+        # provider, across every PR and file it is reviewing
+        self.max_concurrency = config.max_concurrency
         
         if not all([self.endpoint, self.api_key]):
             raise AIProviderError(
@@ -40,15 +242,264 @@ class AzureOpenAIProvider(AIProvider):
                 "azure_openai"
             )
         
-        # Initialize Azure OpenAI client
-        self.client = AsyncAzureOpenAI(
-            azure_endpoint=self.endpoint,
-            api_key=self.api_key,
-            api_version="2024-02-15-preview"
+        # Set by subclasses once they acquire their shared client
+        self._client_key: Optional[_ClientKey] = None
+    
+    def _release(self) -> Optional[Union[AsyncAzureOpenAI, AzureOpenAI]]:
+        """
+        Release this provider's reference to the shared client.
+        
+        Safe to call more than once. Returns the client when no other
+        provider uses it any more, so the caller can close its pool.
+        """
+        if self._client_key is None:
+            return None
+        key, self._client_key = self._client_key, None
+        return _release_client(key)
+    
+    def _select_files(
+        self,
+        pr_data: PullRequestData,
+        config: Dict[str, Any]
+    ) -> Tuple[Sequence[FileChange], List[str]]:
+        """
+        Split the PR's files into those reviewed and those over max_files.
+        
+        Returns:
+            The files to review, and the names of the files skipped
+        """
+        max_files = config.get("max_files", 10)
+        skipped_files = [fc.filename for fc in pr_data.files_changed[max_files:]]
+        if skipped_files:
+            self.logger.warning(
+                "Reviewing only the first %s of %s files",
+                max_files, len(pr_data.files_changed)
+            )
+        return pr_data.files_changed[:max_files], skipped_files
+    
+    def _flag_unreviewed(
+        self,
+        result: ReviewResult,
+        failed_files: Sequence[str] = (),
+        skipped_files: Sequence[str] = ()
+    ) -> ReviewResult:
+        """
+        Mark a result that doesn't cover every file of the PR.
+        
+        The PR can't be approved on a review that didn't see all of it: the
+        result names the files that weren't reviewed, is not approved and is
+        marked partial so it isn't cached.
+        """
+        notes = []
+        if failed_files:
+            notes.append(f"not reviewed (review failed): {', '.join(failed_files)}")
+        if skipped_files:
+            notes.append(f"not reviewed (over max_files): {', '.join(skipped_files)}")
+        if not notes:
+            return result
+        
+        return dataclasses.replace(
+            result,
+            summary="; ".join([result.summary, *notes]),
+            approved=False,
+            partial=True
+        )
+    
+    def _merge_outcomes(
+        self,
+        files: Sequence[FileChange],
+        outcomes: Sequence[Union[ReviewResult, BaseException]],
+        skipped_files: Sequence[str] = ()
+    ) -> ReviewResult:
+        """
+        Merge per-file outcomes, including files whose review failed.
+        
+        A failed file should not discard the reviews of the others; the
+        merged result is flagged by _flag_unreviewed instead. The first error
+        is raised when every file failed.
+        """
+        reviewed_files, results, failed_files = [], [], []
+        for file_change, outcome in zip(files, outcomes):
+            if isinstance(outcome, BaseException):
+                self.logger.warning("Could not review %s: %s", file_change.filename, outcome)
+                failed_files.append(file_change.filename)
+                continue
+            reviewed_files.append(file_change)
+            results.append(outcome)
+        
+        if not results:
+            raise outcomes[0]
+        
+        return self._flag_unreviewed(
+            self._merge_results(reviewed_files, results),
+            failed_files,
+            skipped_files
+        )
+    
+    def _merge_results(
+        self,
+        files: Sequence[FileChange],
+        results: Sequence[ReviewResult]
+    ) -> ReviewResult:
+        """Combine per-file review results into a single PR review."""
+        comments: List[ReviewComment] = []
+        for file_change, result in zip(files, results):
+            for comment in result.comments:
+                # Per-file prompts may omit the filename - attribute it to the file reviewed
+                if comment.filename is None:
+                    comment = dataclasses.replace(comment, filename=file_change.filename)
+                comments.append(comment)
+        
+        return ReviewResult(
+            summary="; ".join(
+                f"{file_change.filename}: {result.summary}"
+                for file_change, result in zip(files, results)
+            ),
+            comments=comments,
+            overall_score=round(sum(r.overall_score for r in results) / len(results)),
+            approved=all(r.approved for r in results)
+        )
+    
+    def _create_pr_header(self, pr_data: PullRequestData) -> str:
+        """Create the PR-level part of the analysis prompt."""
+        return _PR_HEADER_TEMPLATE.substitute(
+            title=pr_data.title,
+            body=pr_data.body[:500],
+            author=pr_data.author,
+            file_count=len(pr_data.files_changed),
+            total_changes=pr_data.get_total_changes()
+        )
+    
+    def _create_analysis_prompt(
+        self,
+        pr_header: str,
+        file_changes: Sequence[FileChange],
+        config: Dict[str, Any]
+    ) -> str:
+        """Create analysis prompt from the PR header and the given file changes."""
+        # Only PR-specific data goes here; the static instructions live in
+        # the system message so every request shares the same prefix.
+        # Files are plain "- name [status] +adds/-dels" lines followed by the
+        # raw patch - far fewer tokens than an indented JSON dump.
+        max_patch_tokens = config.get("max_patch_tokens", 300)
+        lines = [pr_header, "", "File Changes:"]
+        for file_change in file_changes:
+            lines.append(
+                f"- {file_change.filename} [{file_change.status}] "
+                f"+{file_change.additions}/-{file_change.deletions}"
+            )
+            if file_change.patch:
+                lines.append(self._truncate_to_tokens(file_change.patch, max_patch_tokens))
+        
+        return "\n".join(lines)
+    
+    def _truncate_to_tokens(self, text: str, max_tokens: int) -> str:
+        """
+        Truncate text to at most max_tokens tokens of the deployment's tokenizer.
+        
+        Unlike a character slice, this keeps every patch to a predictable
+        share of the prompt regardless of how densely it tokenizes.
+        """
+        if len(text.encode()) <= max_tokens:
+            # Tokens are byte-level, so each covers at least one UTF-8 byte -
+            # but a single non-ASCII character can take several tokens
+            return text
+        
+        encoding = _get_encoding(self.deployment_name)
+        if encoding is None:
+            # No tokenizer: a byte cap never exceeds max_tokens either
+            return text.encode()[:max_tokens].decode(errors="ignore")
+        
+        tokens = encoding.encode(text, disallowed_special=())
+        if len(tokens) <= max_tokens:
+            return text
+        return encoding.decode(tokens[:max_tokens])
+    
+    def _completion_params(self, prompt: str, config: Dict[str, Any]) -> Dict[str, Any]:
+        """Build the chat.completions.create arguments for a review prompt."""
+        params = {
+            "model": self.deployment_name,
+            "messages": [_SYSTEM_MESSAGE, {"role": "user", "content": prompt}],
+            "max_tokens": config.get("max_tokens", 1500),
+            "temperature": config.get("temperature", 0.1),
+            # Constrain the model to valid JSON matching ReviewResult
+            "response_format": _RESPONSE_FORMAT,
+            "stream": True
+        }
+        if self.prompt_cache_key:
+            # Routes requests with the same static prefix to the same prompt
+            # cache. Opt-in: API versions that don't define the parameter
+            # reject the request with a 400, and automatic prefix caching
+            # works without it.
+            params["extra_body"] = {"prompt_cache_key": self.prompt_cache_key}
+        return params
+    
+    def _parse_response(self, response: str) -> ReviewResult:
+        """
+        Parse Azure OpenAI response into ReviewResult.
+        
+        The response shape is enforced by _REVIEW_SCHEMA, so a response that
+        still fails to parse (e.g. cut off at max_tokens) is reported as an
+        error instead of being turned into a made-up approval.
+        """
+        try:
+            return ReviewResult.from_dict(orjson.loads(response))
+        except (ValueError, KeyError) as e:
+            self.logger.error("Failed to parse response: %s", e)
+            raise AIProviderError(f"Invalid response format: {e}", "azure_openai")
+
+
+class AzureOpenAIProvider(_AzureOpenAIBase):
+    """
+    Azure OpenAI implementation of AIProvider.
+    
+    SOLID Principles Applied:
+    - Single Responsibility: Only handles Azure OpenAI interactions
+    - Open/Closed: Implements interface without modifying it
+    - Liskov Substitution: Can replace any AIProvider
+    - Dependency Inversion: Depends on AIProvider abstraction
+    """
+    
+    def __init__(self):
+        """Initialize Azure OpenAI client with environment variables."""
+        super().__init__()
+        
+        # Azure OpenAI client - shared across requests and provider instances
+        # so TCP/TLS handshakes and pool warm-up are paid only once
+        self._client_key, self.client = _acquire_client(
+            AsyncAzureOpenAI, _create_http_client, self.endpoint, self.api_key
         )
         
+        # One limiter for all requests made through this provider, so
+        # concurrent PR reviews can't multiply the per-PR file fan-out
+        self._request_slots = asyncio.Semaphore(self.max_concurrency)
+        
         self.logger.info("Azure OpenAI provider initialized")
     
+    async def aclose(self) -> None:
+        """Release the shared client, closing its pool if no other provider uses it."""
+        client = self._release()
+        if client is not None:
+            await client.close()
+    
+    def analyze_pull_request_sync(
+        self,
+        pr_data: PullRequestData,
+        config: Dict[str, Any]
+    ) -> ReviewResult:
+        """
+        Not supported - use AzureOpenAISyncProvider for blocking reviews.
+        
+        The request limiter and the pooled async client belong to one event
+        loop; the base class's asyncio.run() per call would start a new loop
+        each time and break both from the second call on.
+        """
+        raise AIProviderError(
+            "AzureOpenAIProvider is async-only; use AzureOpenAISyncProvider "
+            "for blocking reviews",
+            "azure_openai"
+        )
+    
     async def analyze_pull_request(
         self, 
         pr_data: PullRequestData, 
@@ -61,131 +512,168 @@ class AzureOpenAIProvider(AIProvider):
         - Proper error handling with exponential backoff
         - Secure credential handling
         - Logging for monitoring
+        
+        Multi-file PRs are reviewed with one prompt per file. The requests run
+        concurrently (bounded by the provider-wide max_concurrency) so latency
+        is close to that of a single call instead of growing with the file
+        count.
         """
         try:
-            self.logger.info(f"Analyzing PR #{pr_data.number}: {pr_data.title}")
+            self.logger.info("Analyzing PR #%s: %s", pr_data.number, pr_data.title)
+            
+            files, skipped_files = self._select_files(pr_data, config)
+            
+            # The PR-level part of the prompt is the same for every file
+            pr_header = self._create_pr_header(pr_data)
             
-            # Prepare analysis prompt
-            prompt = self._create_analysis_prompt(pr_data)
+            if len(files) <= 1:
+                # Single prompt - nothing to fan out
+                prompt = self._create_analysis_prompt(pr_header, files, config)
+                response = await self._call_azure_openai_with_retry(prompt, config)
+                return self._flag_unreviewed(
+                    self._parse_response(response), skipped_files=skipped_files
+                )
             
-            # Call Azure OpenAI with retry logic
-            response = await self._call_azure_openai_with_retry(prompt, config)
+            # One prompt per file; _call_azure_openai_with_retry limits how
+            # many are in flight
+            outcomes = await asyncio.gather(*(
+                self._analyze_file(pr_header, file_change, config)
+                for file_change in files
+            ), return_exceptions=True)
             
-            # Parse and return results
-            return self._parse_response(response)
+            return self._merge_outcomes(files, outcomes, skipped_files)
             
         except Exception as e:
-            self.logger.error(f"Error analyzing PR: {e}")
+            self.logger.error("Error analyzing PR: %s", e)
             raise AIProviderError(f"Analysis failed: {e}", "azure_openai")
     
-    def _create_analysis_prompt(self, pr_data: PullRequestData) -> str:
-        """Create analysis prompt from PR data."""
-        files_info = []
-        for file_change in pr_data.files_changed[:5]:  # Limit to first 5 files
-            files_info.append({
-                "filename": file_change.filename,
-                "status": file_change.status,
-                "changes": f"+{file_change.additions}/-{file_change.deletions}",
-                "patch": file_change.patch[:1000] if file_change.patch else None  # Truncate
-            })
-        
-        return f"""
-        You are a senior code reviewer. Analyze this pull request and provide feedback.
-        
-        PR Title: {pr_data.title}
-        Description: {pr_data.body[:500]}  # Truncate description
-        Author: {pr_data.author}
-        Files changed: {len(pr_data.files_changed)}
-        Total changes: {pr_data.get_total_changes()} lines
-        
-        File Changes:
-        {json.dumps(files_info, indent=2)}
-        
-        Provide your review in this JSON format:
-        {{
-            "summary": "Brief overall assessment",
-            "comments": [
-                {{
-                    "filename": "file.py or null",
-                    "line_number": 123 or null,
-                    "message": "Specific feedback",
-                    "severity": "info|warning|error"
-                }}
-            ],
-            "overall_score": 7,
-            "approved": true
-        }}
-        
-        Focus on: code quality, best practices, potential bugs, security issues.
-        Keep comments constructive and specific.
-        """
+    async def _analyze_file(
+        self,
+        pr_header: str,
+        file_change: FileChange,
+        config: Dict[str, Any]
+    ) -> ReviewResult:
+        """Review a single file change."""
+        prompt = self._create_analysis_prompt(pr_header, [file_change], config)
+        response = await self._call_azure_openai_with_retry(prompt, config)
+        return self._parse_response(response)
     
     async def _call_azure_openai_with_retry(
         self, 
         prompt: str, 
-        config: Dict[str, Any],
-        max_retries: int = 3
+        config: Dict[str, Any]
     ) -> str:
-        """Call Azure OpenAI with exponential backoff retry logic."""
-        last_exception = None
-        
-        for attempt in range(max_retries):
-            try:
-                response = await self.client.chat.completions.create(
-                    model=self.deployment_name,
-                    messages=[
-                        {"role": "system", "content": "You are a helpful code reviewer."},
-                        {"role": "user", "content": prompt}
-                    ],
-                    max_tokens=config.get("max_tokens", 1500),
-                    temperature=config.get("temperature", 0.1)
-                )
-                
-                return response.choices[0].message.content or ""
-                
-            except Exception as e:
-                last_exception = e
-                if attempt == max_retries - 1:
-                    break
-                
-                # Exponential backoff
-                wait_time = 2 ** attempt
-                self.logger.warning(f"Retry {attempt + 1} after {wait_time}s: {e}")
-                await asyncio.sleep(wait_time)
-        
-        # If we get here, all retries failed
-        raise AIProviderError(f"All retries failed: {last_exception}", "azure_openai")
+        """
+        Call Azure OpenAI, retrying transient failures.
+        
+        Retries are delegated to the openai SDK, which honours Retry-After on
+        429 responses and uses jittered exponential backoff, so concurrent
+        requests don't retry in lockstep.
+        
+        The completion is streamed: chunks are collected while the model is
+        still generating, and connection or content-filter errors surface at
+        the first bad chunk instead of after the full generation time.
+        """
+        client = self.client.with_options(max_retries=config.get("max_retries", 3))
+        async with self._request_slots:
+            stream = await client.chat.completions.create(
+                **self._completion_params(prompt, config)
+            )
+            return "".join([_chunk_text(chunk) async for chunk in stream])
+
+
+class AzureOpenAISyncProvider(_AzureOpenAIBase):
+    """
+    Blocking Azure OpenAI provider for single-PR scripts.
     
-    def _parse_response(self, response: str) -> ReviewResult:
-        """Parse Azure OpenAI response into ReviewResult."""
+    Shares prompt building and response parsing with AzureOpenAIProvider but
+    calls Azure through the synchronous AzureOpenAI client, so a one-off
+    review doesn't need an event loop. Per-file requests run on a thread pool.
+    """
+    
+    def __init__(self):
+        """Initialize the blocking Azure OpenAI client with environment variables."""
+        super().__init__()
+        self._client_key, self.client = _acquire_client(
+            AzureOpenAI, _create_sync_http_client, self.endpoint, self.api_key
+        )
+        # Shared by every thread calling this provider, like the async
+        # provider's request limiter
+        self._request_slots = threading.BoundedSemaphore(self.max_concurrency)
+        self.logger.info("Azure OpenAI sync provider initialized")
+    
+    def close(self) -> None:
+        """Release the shared client, closing its pool if no other provider uses it."""
+        client = self._release()
+        if client is not None:
+            client.close()
+    
+    def __enter__(self) -> "AzureOpenAISyncProvider":
+        return self
+    
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+    
+    async def aclose(self) -> None:
+        self.close()
+    
+    async def analyze_pull_request(
+        self,
+        pr_data: PullRequestData,
+        config: Dict[str, Any]
+    ) -> ReviewResult:
+        """Run the blocking analysis in a worker thread for async callers."""
+        return await asyncio.to_thread(self.analyze_pull_request_sync, pr_data, config)
+    
+    def analyze_pull_request_sync(
+        self,
+        pr_data: PullRequestData,
+        config: Dict[str, Any]
+    ) -> ReviewResult:
+        """Analyze pull request using Azure OpenAI without an event loop."""
         try:
-            # Extract JSON from response
-            data = json.loads(response)
+            self.logger.info("Analyzing PR #%s: %s", pr_data.number, pr_data.title)
+            
+            files, skipped_files = self._select_files(pr_data, config)
+            pr_header = self._create_pr_header(pr_data)
             
-            # Convert comments
-            comments = []
-            for comment_data in data.get("comments", []):
-                comment = ReviewComment(
-                    filename=comment_data.get("filename"),
-                    line_number=comment_data.get("line_number"),
-                    message=comment_data["message"],
-                    severity=ReviewSeverity(comment_data.get("severity", "info"))
+            if len(files) <= 1:
+                prompt = self._create_analysis_prompt(pr_header, files, config)
+                response = self._call_azure_openai_sync(prompt, config)
+                return self._flag_unreviewed(
+                    self._parse_response(response), skipped_files=skipped_files
                 )
-                comments.append(comment)
             
-            return ReviewResult(
-                summary=data["summary"],
-                comments=comments,
-                overall_score=data.get("overall_score", 5),
-                approved=data.get("approved", True)
-            )
+            # One prompt per file; _call_azure_openai_sync limits how many
+            # are in flight
+            with concurrent.futures.ThreadPoolExecutor(
+                max_workers=min(len(files), self.max_concurrency)
+            ) as executor:
+                futures = [
+                    executor.submit(self._analyze_file_sync, pr_header, file_change, config)
+                    for file_change in files
+                ]
+            outcomes = [future.exception() or future.result() for future in futures]
             
-        except (json.JSONDecodeError, KeyError) as e:
-            self.logger.error(f"Failed to parse response: {e}")
-            # Fallback result
-            return ReviewResult(
-                summary="Analysis completed but response format was invalid",
-                comments=[],
-                overall_score=5,
-                approved=True
-            )
+            return self._merge_outcomes(files, outcomes, skipped_files)
+            
+        except Exception as e:
+            self.logger.error("Error analyzing PR: %s", e)
+            raise AIProviderError(f"Analysis failed: {e}", "azure_openai")
+    
+    def _analyze_file_sync(
+        self,
+        pr_header: str,
+        file_change: FileChange,
+        config: Dict[str, Any]
+    ) -> ReviewResult:
+        """Review a single file change."""
+        prompt = self._create_analysis_prompt(pr_header, [file_change], config)
+        return self._parse_response(self._call_azure_openai_sync(prompt, config))
+    
+    def _call_azure_openai_sync(self, prompt: str, config: Dict[str, Any]) -> str:
+        """Blocking counterpart of _call_azure_openai_with_retry."""
+        client = self.client.with_options(max_retries=config.get("max_retries", 3))
+        with self._request_slots:
+            stream = client.chat.completions.create(**self._completion_params(prompt, config))
+            return "".join(map(_chunk_text, stream))
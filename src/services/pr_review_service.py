@@ -3,14 +3,63 @@ PR Review Service - Single Responsibility Principle.
 Orchestrates the PR review process.
 """
 
+import asyncio
 import os
-from typing import Dict, Any
+import re
+from collections import OrderedDict
+from typing import Dict, Any, List, Optional, Sequence, Tuple, Union
+from ..config import get_config
 from ..interfaces.ai_provider import AIProvider
 from ..models.pr_data import PullRequestData
 from ..models.review_result import ReviewResult
 from ..utils.logger import get_logger
 
 
+# Extensions of documentation files - PRs touching only these skip the AI
+# review. txt is deliberately absent: requirements.txt, CMakeLists.txt and
+# similar manifests change what gets built and must be reviewed.
+_DOC_EXTENSIONS = frozenset({"md", "rst"})
+
+# Minified bundles - generated, not worth an AI review. Lock files are not
+# listed: dependency bumps are a supply-chain risk and get a real review.
+_GENERATED_FILE_PATTERN = re.compile(r"\.min\.(js|css)$")
+
+
+def is_trivial_change(pr_data: PullRequestData, min_changes: int = 0) -> bool:
+    """
+    Check whether a PR is too trivial to be worth an AI review.
+    
+    Only looks at file names and line counts, so it can run before any AI
+    provider is created.
+    
+    Args:
+        pr_data: Pull request to check
+        min_changes: PRs changing fewer lines count as trivial (0 disables)
+        
+    Returns:
+        True when every changed file is documentation or a minified bundle,
+        or when fewer than min_changes lines changed
+    """
+    if pr_data.get_total_changes() < min_changes:
+        return True
+    
+    return all(
+        os.path.splitext(fc.filename)[1][1:].lower() in _DOC_EXTENSIONS
+        or _GENERATED_FILE_PATTERN.search(fc.filename)
+        for fc in pr_data.files_changed
+    )
+
+
+def trivial_review_result() -> ReviewResult:
+    """Auto-approved result for PRs accepted by is_trivial_change."""
+    return ReviewResult(
+        summary="Trivial change; auto-approved",
+        comments=[],
+        overall_score=10,
+        approved=True
+    )
+
+
 class PRReviewService:
     """
     Service for orchestrating pull request reviews.
@@ -21,6 +70,9 @@ class PRReviewService:
     - Open/Closed: Open for extension with new features
     """
     
+    # Number of review results kept in the in-memory cache
+    RESULT_CACHE_SIZE = 256
+    
     def __init__(self, ai_provider: AIProvider):
         """
         Initialize with AI provider dependency injection.
@@ -33,6 +85,14 @@ class PRReviewService:
         
         # Load configuration from environment
         self.config = self._load_config()
+        
+        # LRU cache of results keyed by PullRequestData.get_content_hash(), so
+        # re-reviewing identical content skips the AI provider entirely
+        self._result_cache: "OrderedDict[str, ReviewResult]" = OrderedDict()
+        
+        # Provider calls still running, by the same key, so concurrent reviews
+        # of identical content (e.g. duplicates in one batch) share one call
+        self._in_flight: Dict[str, "asyncio.Future[ReviewResult]"] = {}
     
     async def review_pull_request(self, pr_data: PullRequestData) -> ReviewResult:
         """
@@ -44,29 +104,154 @@ class PRReviewService:
         Returns:
             ReviewResult: Analysis results and recommendations
         """
-        self.logger.info(f"Starting review for PR #{pr_data.number}")
-        
         try:
-            # Validate PR data
-            self._validate_pr_data(pr_data)
+            cache_key, early_result = self._begin_review(pr_data)
+            if early_result is not None:
+                return early_result
             
             # Perform analysis using AI provider
-            result = await self.ai_provider.analyze_pull_request(pr_data, self.config)
+            result = await self._analyze_once(pr_data, cache_key)
+            return self._finish_review(pr_data, cache_key, result)
             
-            self.logger.info(f"Review completed for PR #{pr_data.number}")
-            return result
+        except Exception as e:
+            self.logger.error("Review failed for PR #%s: %s", pr_data.number, e)
+            raise
+    
+    def review_pull_request_sync(self, pr_data: PullRequestData) -> ReviewResult:
+        """
+        Review a pull request without an event loop.
+        
+        Intended for scripts reviewing a single PR; pair it with
+        AzureOpenAISyncProvider so the provider call blocks natively.
+        
+        Args:
+            pr_data: Pull request data to review
+            
+        Returns:
+            ReviewResult: Analysis results and recommendations
+        """
+        try:
+            cache_key, early_result = self._begin_review(pr_data)
+            if early_result is not None:
+                return early_result
+            
+            result = self.ai_provider.analyze_pull_request_sync(pr_data, self.config)
+            return self._finish_review(pr_data, cache_key, result)
             
         except Exception as e:
-            self.logger.error(f"Review failed for PR #{pr_data.number}: {e}")
+            self.logger.error("Review failed for PR #%s: %s", pr_data.number, e)
             raise
     
+    async def review_pull_requests(
+        self,
+        prs: Sequence[PullRequestData]
+    ) -> List[Union[ReviewResult, BaseException]]:
+        """
+        Review several pull requests concurrently.
+        
+        All reviews share the provider's connection pool and its request
+        limit, so PR_REVIEW_CONCURRENCY bounds the Azure OpenAI calls in
+        flight across the whole batch. A failed review does not cancel the
+        others.
+        
+        Args:
+            prs: Pull requests to review
+            
+        Returns:
+            One entry per PR, in order: its ReviewResult, or the exception
+            raised while reviewing it
+        """
+        return await asyncio.gather(
+            *(self.review_pull_request(pr_data) for pr_data in prs),
+            return_exceptions=True
+        )
+    
+    async def _analyze_once(self, pr_data: PullRequestData, cache_key: str) -> ReviewResult:
+        """
+        Run the provider, joining an identical review that is already running.
+        
+        The result cache only helps once a review has finished; this covers
+        reviews that start while the first one is still waiting on the AI.
+        """
+        task = self._in_flight.get(cache_key)
+        if task is None:
+            task = asyncio.ensure_future(
+                self.ai_provider.analyze_pull_request(pr_data, self.config)
+            )
+            self._in_flight[cache_key] = task
+            task.add_done_callback(lambda _: self._in_flight.pop(cache_key, None))
+        else:
+            self.logger.info("Joining in-flight review for PR #%s", pr_data.number)
+        
+        # Shielded so one cancelled caller doesn't cancel the shared call
+        return await asyncio.shield(task)
+    
+    def _begin_review(self, pr_data: PullRequestData) -> Tuple[str, Optional[ReviewResult]]:
+        """
+        Run the steps that precede the AI call.
+        
+        Validates the PR and checks the result cache and the trivial-change
+        filter.
+        
+        Returns:
+            The cache key for the PR, and the result to return without
+            calling the provider (or None when the AI review is needed)
+            
+        Raises:
+            ValueError: If PR data is invalid
+        """
+        self.logger.info("Starting review for PR #%s", pr_data.number)
+        self._validate_pr_data(pr_data)
+        
+        cache_key = pr_data.get_content_hash()
+        cached = self._get_cached_result(cache_key)
+        if cached is not None:
+            self.logger.info("Reusing cached review for PR #%s", pr_data.number)
+            return cache_key, cached
+        
+        if is_trivial_change(pr_data, self.config.get("min_changes", 0)):
+            self.logger.info("Skipping AI review for trivial PR #%s", pr_data.number)
+            return cache_key, trivial_review_result()
+        
+        return cache_key, None
+    
+    def _finish_review(
+        self,
+        pr_data: PullRequestData,
+        cache_key: str,
+        result: ReviewResult
+    ) -> ReviewResult:
+        """Cache the provider's result (unless partial) and return it."""
+        if not result.partial:
+            self._cache_result(cache_key, result)
+        self.logger.info("Review completed for PR #%s", pr_data.number)
+        return result
+    
+    def _get_cached_result(self, cache_key: str) -> Optional[ReviewResult]:
+        """Return the cached result for cache_key, marking it most recently used."""
+        cached = self._result_cache.get(cache_key)
+        if cached is not None:
+            self._result_cache.move_to_end(cache_key)
+        return cached
+    
+    def _cache_result(self, cache_key: str, result: ReviewResult) -> None:
+        """Store a result, evicting the least recently used one when full."""
+        self._result_cache[cache_key] = result
+        if len(self._result_cache) > self.RESULT_CACHE_SIZE:
+            self._result_cache.popitem(last=False)
+    
     def _load_config(self) -> Dict[str, Any]:
-        """Load configuration from environment variables."""
+        """Load configuration from the shared application config."""
+        config = get_config()
         return {
-            "max_tokens": int(os.getenv("MAX_TOKENS", "1500")),
-            "temperature": float(os.getenv("TEMPERATURE", "0.1")),
-            "max_files": int(os.getenv("MAX_FILES", "10")),
-            "max_patch_size": int(os.getenv("MAX_PATCH_SIZE", "1000"))
+            "max_tokens": config.max_tokens,
+            "temperature": config.temperature,
+            "max_retries": config.max_retries,
+            "max_files": config.max_files,
+            # Patches are truncated to this many tokens in the prompt
+            "max_patch_tokens": config.max_patch_tokens,
+            # PRs changing fewer lines are auto-approved without the AI
+            "min_changes": config.min_review_changes
         }
     
     def _validate_pr_data(self, pr_data: PullRequestData) -> None:
@@ -88,4 +273,4 @@ class PRReviewService:
         if pr_data.get_total_changes() == 0:
             raise ValueError("PR must have actual code changes")
         
-        self.logger.debug(f"PR data validation passed for #{pr_data.number}")
+        self.logger.debug("PR data validation passed for #%s", pr_data.number)
@@ -5,7 +5,11 @@ Centralized logging configuration.
 
 import logging
 import os
-from typing import Optional
+from typing import Dict, Optional
+
+
+# Loggers already configured by get_logger, by name
+_LOGGERS: Dict[str, logging.Logger] = {}
 
 
 def get_logger(name: str, level: Optional[str] = None) -> logging.Logger:
@@ -21,15 +25,21 @@ def get_logger(name: str, level: Optional[str] = None) -> logging.Logger:
     Returns:
         Configured logger instance
     """
+    cached = _LOGGERS.get(name)
+    if cached is not None:
+        return cached
+    
     logger = logging.getLogger(name)
     
     if not logger.handlers:
         # Configure handler only once
         handler = logging.StreamHandler()
         
-        # Set format
+        # Set format - %(created) is the raw epoch timestamp already on the
+        # record, avoiding the strftime/localtime call %(asctime)s makes per
+        # record (GitHub Actions adds wall-clock timestamps to the log anyway)
         formatter = logging.Formatter(
-            '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+            '%(created).3f - %(name)s - %(levelname)s - %(message)s'
         )
         handler.setFormatter(formatter)
         logger.addHandler(handler)
@@ -38,4 +48,5 @@ def get_logger(name: str, level: Optional[str] = None) -> logging.Logger:
         log_level = level or os.getenv("LOG_LEVEL", "INFO")
         logger.setLevel(getattr(logging, log_level.upper()))
     
+    _LOGGERS[name] = logger
     return logger
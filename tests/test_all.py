@@ -0,0 +1,825 @@
+"""
+Tests for the project structure, models, review service and providers.
+
+No network access is needed: the AI provider and the Azure OpenAI client
+are replaced by fakes.
+
+Run with: python -m pytest tests/
+"""
+
+import asyncio
+import json
+import os
+import sys
+from types import SimpleNamespace
+
+import pytest
+
+# Import the application as the "src" package so relative imports resolve
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+
+@pytest.fixture(scope="session")
+def models():
+    """Model classes, imported once for the whole test session."""
+    from src.models.pr_data import PullRequestData, FileChange
+    from src.models.review_result import ReviewResult, ReviewComment, ReviewSeverity
+    
+    return SimpleNamespace(
+        PullRequestData=PullRequestData,
+        FileChange=FileChange,
+        ReviewResult=ReviewResult,
+        ReviewComment=ReviewComment,
+        ReviewSeverity=ReviewSeverity
+    )
+
+
+@pytest.fixture(scope="session")
+def pr_data(models):
+    """Single-file pull request shared by the model tests."""
+    return models.PullRequestData(
+        number=123,
+        title="Test PR",
+        body="Test description",
+        author="test_user",
+        base_branch="main",
+        head_branch="feature",
+        files_changed=[
+            models.FileChange(
+                filename="test.py",
+                status="modified",
+                additions=10,
+                deletions=2
+            )
+        ]
+    )
+
+
+@pytest.fixture
+def configure(monkeypatch):
+    """
+    Set environment variables and re-read the application config.
+    
+    Azure credentials point at a dummy endpoint; nothing is ever sent to it.
+    """
+    from src.config import get_config
+    
+    monkeypatch.setenv("AZURE_OPENAI_ENDPOINT", "https://example.openai.azure.com/")
+    monkeypatch.setenv("AZURE_OPENAI_API_KEY", "test-key")
+    for name in ("PR_REVIEW_CACHE_DIR", "RUNNER_TOOL_CACHE", "GITHUB_OUTPUT"):
+        monkeypatch.delenv(name, raising=False)
+    
+    def apply(**env):
+        for name, value in env.items():
+            monkeypatch.setenv(name, str(value))
+        get_config.cache_clear()
+        return get_config()
+    
+    apply()
+    yield apply
+    get_config.cache_clear()
+
+
+@pytest.fixture(scope="session")
+def fake_provider_class(models):
+    """AIProvider returning a canned review and recording every call."""
+    from src.interfaces.ai_provider import AIProvider
+    
+    class FakeProvider(AIProvider):
+        def __init__(self, delay=0.0):
+            self.calls = []
+            self.delay = delay
+        
+        async def analyze_pull_request(self, pr_data, config):
+            self.calls.append(pr_data.number)
+            await asyncio.sleep(self.delay)
+            return models.ReviewResult(
+                summary="Looks good",
+                comments=[],
+                overall_score=8,
+                approved=True
+            )
+    
+    return FakeProvider
+
+
+def _review_json(summary="ok", score=8, approved=True):
+    """A completion body as the model returns it."""
+    return json.dumps({
+        "summary": summary,
+        "comments": [],
+        "overall_score": score,
+        "approved": approved
+    })
+
+
+class _FakeStream:
+    """Streamed completion made of the response text, split into chunks."""
+    
+    def __init__(self, text):
+        self.chunks = [
+            SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=text[i:i + 7]))])
+            for i in range(0, len(text), 7)
+        ]
+        # Azure also streams chunks without choices (prompt filter results)
+        self.chunks.insert(0, SimpleNamespace(choices=[]))
+    
+    def __iter__(self):
+        return iter(self.chunks)
+    
+    async def __aiter__(self):
+        for chunk in self.chunks:
+            yield chunk
+
+
+class _FakeClient:
+    """
+    Stand-in for the (Async)AzureOpenAI client.
+    
+    respond(prompt) returns the completion text or raises; every request's
+    arguments are recorded in requests. Async requests take delay seconds,
+    and the highest number seen in flight at once is kept in max_in_flight.
+    """
+    
+    def __init__(self, respond, is_async, delay=0.0):
+        self.respond = respond
+        self.requests = []
+        self.closed = False
+        self.delay = delay
+        self.in_flight = 0
+        self.max_in_flight = 0
+        create = self._acreate if is_async else self._create
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=create))
+    
+    def with_options(self, **options):
+        return self
+    
+    def _create(self, **params):
+        self.requests.append(params)
+        return _FakeStream(self.respond(params["messages"][-1]["content"]))
+    
+    async def _acreate(self, **params):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+            return self._create(**params)
+        finally:
+            self.in_flight -= 1
+    
+    def close(self):
+        self.closed = True
+
+
+def _pr(models, *files, number=1):
+    """Pull request with the given (filename, patch) changes."""
+    return models.PullRequestData(
+        number=number,
+        title="Test PR",
+        body="",
+        author="test_user",
+        base_branch="main",
+        head_branch="feature",
+        files_changed=[
+            models.FileChange(filename=name, status="modified", additions=5, deletions=1, patch=patch)
+            for name, patch in files
+        ]
+    )
+
+
+def test_imports():
+    """Test that all modules can be imported successfully."""
+    # Provider imports need the openai package, so they are not probed here
+    from src.interfaces.ai_provider import AIProvider, AIProviderError
+    from src.models.pr_data import PullRequestData, FileChange
+    from src.models.review_result import ReviewResult, ReviewComment, ReviewSeverity
+    from src.services.pr_review_service import PRReviewService
+    from src.utils.logger import get_logger
+
+
+def test_pr_data(models, pr_data):
+    """Test PullRequestData totals and file extensions."""
+    assert pr_data.get_total_changes() == 12
+    assert pr_data.get_file_extensions() == ["py"]
+    
+    # Extensions come from the file name only, not dotted directories
+    multi_pr = models.PullRequestData(
+        number=124,
+        title="Multi-file PR",
+        body="",
+        author="test_user",
+        base_branch="main",
+        head_branch="feature",
+        files_changed=[
+            pr_data.files_changed[0],
+            models.FileChange(filename="docs.v2/Makefile", status="added", additions=3, deletions=0),
+            models.FileChange(filename="README.MD", status="modified", additions=1, deletions=1)
+        ]
+    )
+    assert multi_pr.get_total_changes() == 17
+    assert multi_pr.get_file_extensions() == ["md", "py"]
+
+
+def test_review_result(models):
+    """Test severity buckets and blocking issue detection."""
+    comment = models.ReviewComment(
+        filename="test.py",
+        line_number=10,
+        message="Good code!",
+        severity=models.ReviewSeverity.INFO
+    )
+    
+    result = models.ReviewResult(
+        summary="Looks good",
+        comments=[comment],
+        overall_score=8,
+        approved=True
+    )
+    assert len(result.get_comments_by_severity(models.ReviewSeverity.INFO)) == 1
+    
+    # Comments are stored immutably, so the severity buckets can't go stale
+    assert result.comments == (comment,)
+    with pytest.raises(AttributeError):
+        result.comments.append(comment)
+    assert not result.has_blocking_issues()
+    
+    blocking = models.ReviewResult(
+        summary="Needs work",
+        comments=[
+            comment,
+            models.ReviewComment(
+                filename="test.py",
+                line_number=3,
+                message="Bug",
+                severity=models.ReviewSeverity.ERROR
+            )
+        ],
+        overall_score=3,
+        approved=False
+    )
+    assert blocking.has_blocking_issues()
+    assert [c.message for c in blocking.get_comments_by_severity(models.ReviewSeverity.ERROR)] == ["Bug"]
+    assert blocking.get_comments_by_severity(models.ReviewSeverity.WARNING) == []
+
+
+def test_output_format(models):
+    """Test the JSON output and its round trip through the review cache."""
+    result = models.ReviewResult(
+        summary="Test summary",
+        comments=[
+            models.ReviewComment(
+                filename="test.py",
+                line_number=10,
+                message="Test message",
+                severity=models.ReviewSeverity.WARNING
+            )
+        ],
+        overall_score=7,
+        approved=False
+    )
+    
+    result_json = result.to_dict()
+    assert result_json["comments"][0] == {
+        "filename": "test.py",
+        "line_number": 10,
+        "message": "Test message",
+        "severity": "warning"
+    }
+    
+    parsed = json.loads(json.dumps(result_json))
+    restored = models.ReviewResult.from_dict(parsed)
+    assert restored.to_dict() == result_json
+    assert restored.comments[0].severity is models.ReviewSeverity.WARNING
+
+
+def test_logger():
+    """Test logger utility."""
+    from src.utils.logger import get_logger
+    
+    logger = get_logger("test")
+    assert get_logger("test") is logger
+    logger.info("Test log message")
+
+
+def test_interfaces():
+    """Test interface definitions."""
+    from src.interfaces.ai_provider import AIProviderError
+    
+    error = AIProviderError("Test error", "test_provider")
+    assert "Test error" in str(error)
+
+
+def test_sync_provider_reviews_each_file(configure, models):
+    """The blocking provider fans out per file and merges the reviews."""
+    from src.providers.azure_openai_provider import AzureOpenAISyncProvider
+    
+    provider = AzureOpenAISyncProvider()
+    provider.client = _FakeClient(
+        lambda prompt: _review_json("fine" if "a.py" in prompt else "meh", 8 if "a.py" in prompt else 6),
+        is_async=False
+    )
+    
+    result = provider.analyze_pull_request_sync(
+        _pr(models, ("a.py", "+x = 1"), ("b.py", "+y = 2")),
+        {}
+    )
+    
+    assert len(provider.client.requests) == 2
+    assert "a.py: fine" in result.summary and "b.py: meh" in result.summary
+    assert result.overall_score == 7
+    assert result.approved
+
+
+def test_sync_provider_serves_async_callers(configure, models):
+    """Async callers get the blocking review from a worker thread."""
+    from src.providers.azure_openai_provider import AzureOpenAISyncProvider
+    
+    provider = AzureOpenAISyncProvider()
+    provider.client = _FakeClient(lambda prompt: _review_json(), is_async=False)
+    
+    result = asyncio.run(provider.analyze_pull_request(_pr(models, ("a.py", "+x")), {}))
+    
+    assert result.summary == "ok"
+
+
+def test_async_provider_rejects_blocking_calls(configure, models):
+    """Each blocking call fails clearly instead of breaking on a new event loop."""
+    from src.interfaces.ai_provider import AIProviderError
+    from src.providers.azure_openai_provider import AzureOpenAIProvider
+    from src.services.pr_review_service import PRReviewService
+    
+    configure(PR_REVIEW_CONCURRENCY=1)
+    provider = AzureOpenAIProvider()
+    provider.client = _FakeClient(lambda prompt: _review_json(), is_async=True)
+    service = PRReviewService(provider)
+    
+    for number in (1, 2):
+        pr = _pr(models, ("a.py", "+x"), ("b.py", "+y"), number=number)
+        with pytest.raises(AIProviderError, match="AzureOpenAISyncProvider"):
+            service.review_pull_request_sync(pr)
+    
+    assert provider.client.requests == []
+
+
+def test_review_pull_request_sync_uses_result_cache(configure, models, fake_provider_class):
+    """The sync entry point validates, reviews once and then serves the cache."""
+    from src.services.pr_review_service import PRReviewService
+    
+    provider = fake_provider_class()
+    service = PRReviewService(provider)
+    pr = _pr(models, ("a.py", "+x"))
+    
+    first = service.review_pull_request_sync(pr)
+    second = service.review_pull_request_sync(pr)
+    
+    assert second is first
+    assert provider.calls == [1]
+    
+    with pytest.raises(ValueError):
+        service.review_pull_request_sync(_pr(models))
+
+
+def test_shared_client_closed_by_last_provider(configure):
+    """Closing one provider must not close the client other providers use."""
+    from src.providers.azure_openai_provider import AzureOpenAIProvider, AzureOpenAISyncProvider
+    
+    configure(AZURE_OPENAI_API_KEY="shared-client-key")
+    first, second = AzureOpenAIProvider(), AzureOpenAIProvider()
+    assert first.client is second.client
+    
+    asyncio.run(first.aclose())
+    asyncio.run(first.aclose())  # a second close is a no-op
+    assert not second.client.is_closed()
+    
+    asyncio.run(second.aclose())
+    assert second.client.is_closed()
+    
+    # Once closed, the next provider gets a fresh client
+    third = AzureOpenAIProvider()
+    assert third.client is not second.client
+    asyncio.run(third.aclose())
+    
+    with AzureOpenAISyncProvider() as sync_provider, AzureOpenAISyncProvider() as other:
+        assert sync_provider.client is other.client
+        sync_provider.close()
+        assert not other.client.is_closed()
+    assert other.client.is_closed()
+
+
+def _parse_github_output(text):
+    """
+    Parse a $GITHUB_OUTPUT file the way the Actions runner does.
+    
+    Fails on any line that is neither "key=value" nor the start of a
+    "key<<DELIMITER" block, which the runner rejects as an invalid format.
+    """
+    outputs = {}
+    lines = iter(text.splitlines())
+    for line in lines:
+        if "<<" in line and ("=" not in line or line.index("<<") < line.index("=")):
+            key, delimiter = line.split("<<", 1)
+            value = []
+            for value_line in lines:
+                if value_line == delimiter:
+                    break
+                value.append(value_line)
+            else:
+                pytest.fail(f"Unterminated multi-line output {key!r}")
+            outputs[key] = "\n".join(value)
+        else:
+            assert "=" in line, f"Invalid output line: {line!r}"
+            key, value = line.split("=", 1)
+            outputs[key] = value
+    return outputs
+
+
+def test_output_file_accepts_multi_file_summary(configure, models, tmp_path):
+    """A merged multi-file review and a multi-line summary stay valid outputs."""
+    from src.main import _output_results
+    from src.providers.azure_openai_provider import AzureOpenAIProvider
+    
+    output_file = tmp_path / "github_output"
+    configure(GITHUB_OUTPUT=output_file)
+    
+    provider = AzureOpenAIProvider()
+    provider.client = _FakeClient(
+        lambda prompt: _review_json("ok" if "a.py" in prompt else "ok2"),
+        is_async=True
+    )
+    merged = asyncio.run(provider.analyze_pull_request(
+        _pr(models, ("a.py", "+x"), ("b.py", "+y")), {}
+    ))
+    _output_results(merged)
+    
+    outputs = _parse_github_output(output_file.read_text())
+    assert outputs["summary"] == "a.py: ok; b.py: ok2"
+    assert outputs["approved"] == "True"
+    assert json.loads(outputs["review_result"])["summary"] == outputs["summary"]
+    
+    output_file.write_text("")
+    _output_results(models.ReviewResult(
+        summary="First line\nSecond line",
+        comments=[],
+        overall_score=7,
+        approved=True
+    ))
+    outputs = _parse_github_output(output_file.read_text())
+    assert outputs["summary"] == "First line\nSecond line"
+    assert outputs["score"] == "7"
+
+
+def test_failed_file_blocks_approval_and_caching(configure, models):
+    """A file whose review failed is named, blocks approval and isn't cached."""
+    from src.providers.azure_openai_provider import AzureOpenAIProvider
+    from src.services.pr_review_service import PRReviewService
+    
+    def respond(prompt):
+        if "b.py" in prompt:
+            raise RuntimeError("429")
+        return _review_json("fine")
+    
+    provider = AzureOpenAIProvider()
+    provider.client = _FakeClient(respond, is_async=True)
+    service = PRReviewService(provider)
+    pr = _pr(models, ("a.py", "+x"), ("b.py", "+y"))
+    
+    result = asyncio.run(service.review_pull_request(pr))
+    
+    assert not result.approved
+    assert result.partial
+    assert "a.py: fine" in result.summary and "b.py" in result.summary
+    
+    # Not cached: the next review asks the provider again
+    asyncio.run(service.review_pull_request(pr))
+    assert len(provider.client.requests) == 4
+
+
+def test_files_over_max_files_block_approval(configure, models):
+    """Files past max_files are named in the summary, never silently approved."""
+    from src.providers.azure_openai_provider import AzureOpenAIProvider, AzureOpenAISyncProvider
+    
+    pr = _pr(models, ("a.py", "+x"), ("b.py", "+y"), ("c.py", "+z"))
+    
+    provider = AzureOpenAIProvider()
+    provider.client = _FakeClient(lambda prompt: _review_json("fine"), is_async=True)
+    result = asyncio.run(provider.analyze_pull_request(pr, {"max_files": 2}))
+    assert len(provider.client.requests) == 2
+    assert not result.approved and result.partial
+    assert result.summary.endswith("not reviewed (over max_files): c.py")
+    
+    # Single-prompt path of the blocking provider
+    with AzureOpenAISyncProvider() as sync_provider:
+        sync_provider.client = _FakeClient(lambda prompt: _review_json("fine"), is_async=False)
+        result = sync_provider.analyze_pull_request_sync(pr, {"max_files": 1})
+    assert not result.approved and result.partial
+    assert "b.py, c.py" in result.summary
+    
+    asyncio.run(provider.aclose())
+
+
+def test_oversized_diff_is_not_approved(configure, models):
+    """PRs over MAX_REVIEW_CHANGES skip the AI but never report an approval."""
+    from src.main import _pre_review_result
+    
+    configure(MAX_REVIEW_CHANGES=10)
+    pr = models.PullRequestData(
+        number=1,
+        title="Huge PR",
+        body="",
+        author="test_user",
+        base_branch="main",
+        head_branch="feature",
+        files_changed=[models.FileChange(filename="gen.py", status="added", additions=11, deletions=0)]
+    )
+    
+    result = _pre_review_result(pr)
+    
+    assert result is not None
+    assert not result.approved
+    assert "manual review required" in result.summary
+
+
+def test_concurrency_limit_spans_batch_and_files(configure, models):
+    """PR_REVIEW_CONCURRENCY bounds Azure requests across PRs and their files."""
+    from src.providers.azure_openai_provider import AzureOpenAIProvider
+    from src.services.pr_review_service import PRReviewService
+    
+    configure(PR_REVIEW_CONCURRENCY=3)
+    provider = AzureOpenAIProvider()
+    provider.client = _FakeClient(lambda prompt: _review_json(), is_async=True, delay=0.01)
+    service = PRReviewService(provider)
+    prs = [
+        _pr(models, (f"a{n}.py", f"+a{n}"), (f"b{n}.py", f"+b{n}"), (f"c{n}.py", f"+c{n}"), number=n)
+        for n in range(4)
+    ]
+    
+    results = asyncio.run(service.review_pull_requests(prs))
+    
+    assert all(result.approved for result in results)
+    assert len(provider.client.requests) == 12
+    assert provider.client.max_in_flight == 3
+
+
+
+def test_batch_shares_one_call_for_identical_prs(configure, models, fake_provider_class):
+    """Identical PRs in one batch are reviewed once, even while in flight."""
+    from src.services.pr_review_service import PRReviewService
+    
+    provider = fake_provider_class(delay=0.01)
+    service = PRReviewService(provider)
+    duplicates = [_pr(models, ("a.py", "+x"), number=n) for n in range(3)]
+    
+    results = asyncio.run(service.review_pull_requests(duplicates + [_pr(models, ("b.py", "+y"), number=9)]))
+    
+    assert all(result.approved for result in results)
+    assert sorted(provider.calls) == [0, 9]
+    
+    # Finished reviews are then served from the result cache
+    asyncio.run(service.review_pull_requests(duplicates))
+    assert len(provider.calls) == 2
+
+
+def test_truncate_to_tokens_counts_non_ascii(configure, monkeypatch):
+    """Patches are cut by token count, even when they are short in characters."""
+    from src.providers import azure_openai_provider
+    
+    class ByteEncoding:
+        """Worst case for the tokenizer: one token per UTF-8 byte."""
+        
+        def encode(self, text, disallowed_special=()):
+            return list(text.encode())
+        
+        def decode(self, tokens):
+            return bytes(tokens).decode(errors="ignore")
+    
+    monkeypatch.setattr(azure_openai_provider, "_get_encoding", lambda model: ByteEncoding())
+    provider = azure_openai_provider.AzureOpenAIProvider()
+    
+    assert provider._truncate_to_tokens("+x = 1", 10) == "+x = 1"
+    assert provider._truncate_to_tokens("+" + "x" * 20, 10) == "+" + "x" * 9
+    
+    # 6 characters but 24 bytes: must not slip past a 10-token cap
+    truncated = provider._truncate_to_tokens("🎉" * 6, 10)
+    assert len(truncated.encode()) <= 10
+    assert truncated == "🎉🎉"
+    asyncio.run(provider.aclose())
+
+
+def test_truncate_to_tokens_without_tokenizer(configure, monkeypatch):
+    """A tokenizer that can't be downloaded degrades to a byte cap, not a failure."""
+    from src.providers import azure_openai_provider
+    
+    attempts = []
+    
+    def offline(name):
+        attempts.append(name)
+        raise ConnectionError("tokenizer download blocked")
+    
+    monkeypatch.setattr(azure_openai_provider.tiktoken, "encoding_for_model", offline)
+    monkeypatch.setattr(azure_openai_provider.tiktoken, "get_encoding", offline)
+    azure_openai_provider._get_encoding.cache_clear()
+    provider = azure_openai_provider.AzureOpenAIProvider()
+    
+    try:
+        assert provider._truncate_to_tokens("+" + "x" * 20, 10) == "+" + "x" * 9
+        assert provider._truncate_to_tokens("🎉" * 6, 10) == "🎉🎉"
+        # The failed load is cached, so it is attempted (and logged) once
+        assert len(attempts) == 1
+    finally:
+        azure_openai_provider._get_encoding.cache_clear()
+        asyncio.run(provider.aclose())
+
+
+def test_trivial_changes(configure, models, monkeypatch):
+    """Docs-only PRs skip the AI before a provider exists; manifests don't."""
+    from src.main import _pre_review_result
+    from src.services.pr_review_service import is_trivial_change
+    
+    def files(*names):
+        return _pr(models, *((name, "+x") for name in names))
+    
+    assert is_trivial_change(files("README.md", "docs/guide.RST"))
+    assert is_trivial_change(files("README.md", "static/app.min.js"))
+    assert not is_trivial_change(files("requirements.txt"))
+    assert not is_trivial_change(files("CMakeLists.txt"))
+    assert not is_trivial_change(files("package-lock.json"))
+    assert not is_trivial_change(files("README.md", "src/app.py"))
+    assert is_trivial_change(files("src/app.py"), min_changes=10)
+    
+    # No Azure credentials needed for a docs-only PR
+    monkeypatch.delenv("AZURE_OPENAI_ENDPOINT")
+    monkeypatch.delenv("AZURE_OPENAI_API_KEY")
+    configure(MIN_REVIEW_CHANGES=0)
+    result = _pre_review_result(files("README.md"))
+    assert result is not None and result.approved
+    assert _pre_review_result(files("requirements.txt")) is None
+
+
+def test_prompt_cache_key_is_opt_in(configure):
+    """prompt_cache_key is only sent when configured."""
+    from src.providers.azure_openai_provider import AzureOpenAIProvider
+    
+    params = AzureOpenAIProvider()._completion_params("prompt", {})
+    assert "extra_body" not in params
+    
+    configure(AZURE_OPENAI_PROMPT_CACHE_KEY="pr-review")
+    params = AzureOpenAIProvider()._completion_params("prompt", {})
+    assert params["extra_body"] == {"prompt_cache_key": "pr-review"}
+
+
+def test_review_cache_key_covers_model_and_prompt(configure, models, monkeypatch):
+    """Changing the model, prompt or review settings must not reuse cached reviews."""
+    from src import main
+    
+    pr = _pr(models, ("a.py", "+x"))
+    key = main._review_cache_key(pr)
+    assert main._review_cache_key(pr) == key
+    
+    configure(AZURE_OPENAI_DEPLOYMENT_NAME="gpt-4o")
+    assert main._review_cache_key(pr) != key
+    other_model_key = main._review_cache_key(pr)
+    
+    monkeypatch.setattr(main, "REVIEW_PROMPT_VERSION", "pr-review-test")
+    keys = {key, other_model_key, main._review_cache_key(pr)}
+    assert len(keys) == 3
+    
+    # Settings that change what the model sees or how it answers
+    for name, value in (
+        ("MAX_FILES", 50),
+        ("MAX_PATCH_TOKENS", 1000),
+        ("MAX_TOKENS", 4000),
+        ("TEMPERATURE", "0.7")
+    ):
+        configure(**{name: value})
+        new_key = main._review_cache_key(pr)
+        assert new_key not in keys
+        keys.add(new_key)
+
+
+def test_get_config_parsing(configure, tmp_path):
+    """Environment values are converted once; bad numbers fail loudly."""
+    config = configure()
+    assert config.max_tokens == 1500
+    assert config.max_concurrency == 8
+    assert config.min_review_changes == 0
+    assert config.review_cache_dir is None
+    assert config.prompt_cache_key is None
+    assert "test-key" not in repr(config)
+    
+    config = configure(RUNNER_TOOL_CACHE=tmp_path, MAX_FILES=3, TEMPERATURE="0.5")
+    assert config.review_cache_dir == os.path.join(str(tmp_path), "pr-review-cache")
+    assert config.max_files == 3
+    assert config.temperature == 0.5
+    
+    config = configure(PR_REVIEW_CACHE_DIR=tmp_path / "explicit")
+    assert config.review_cache_dir == str(tmp_path / "explicit")
+    
+    with pytest.raises(ValueError):
+        configure(MAX_TOKENS="lots")
+    
+    # Out-of-range limits fail at startup instead of hanging or erroring later
+    for name, bad, good in (
+        ("PR_REVIEW_CONCURRENCY", 0, 1),
+        ("PR_REVIEW_CONCURRENCY", -2, 1),
+        ("MAX_FILES", 0, 1),
+        ("MAX_PATCH_TOKENS", 0, 1),
+        ("MAX_RETRIES", -1, 0)
+    ):
+        with pytest.raises(ValueError, match="at least"):
+            configure(MAX_TOKENS=1500, **{name: bad})
+        configure(**{name: good})
+
+
+def test_pre_review_result_for_empty_pr(configure, models):
+    """PRs without line changes are answered without the AI; real ones aren't."""
+    from src.main import _pre_review_result
+    
+    empty = _pre_review_result(_pr(models))
+    assert empty is not None and empty.approved
+    
+    no_lines = models.PullRequestData(
+        number=1,
+        title="Rename only",
+        body="",
+        author="test_user",
+        base_branch="main",
+        head_branch="feature",
+        files_changed=[models.FileChange(filename="a.py", status="renamed", additions=0, deletions=0)]
+    )
+    assert _pre_review_result(no_lines).summary == "No code changes detected"
+    
+    assert _pre_review_result(_pr(models, ("a.py", "+x"))) is None
+
+
+def test_disk_cache_round_trip_and_errors(configure, models, tmp_path):
+    """Cached reviews round-trip; unreadable or unwritable caches are ignored."""
+    from src.main import _load_cached_review, _store_cached_review
+    
+    result = models.ReviewResult(
+        summary="Cached",
+        comments=[
+            models.ReviewComment(
+                filename="a.py",
+                line_number=3,
+                message="Bug",
+                severity=models.ReviewSeverity.ERROR
+            )
+        ],
+        overall_score=4,
+        approved=False
+    )
+    
+    # Caching disabled: nothing is stored or found
+    _store_cached_review("key", result)
+    assert _load_cached_review("key") is None
+    
+    cache_dir = tmp_path / "cache"
+    configure(PR_REVIEW_CACHE_DIR=cache_dir)
+    assert _load_cached_review("key") is None
+    
+    _store_cached_review("key", result)
+    restored = _load_cached_review("key")
+    assert restored.to_dict() == result.to_dict()
+    assert restored.has_blocking_issues()
+    assert [p.name for p in cache_dir.iterdir()] == ["key.json"]
+    # Readable by the non-root user that saves the cache after the job
+    assert (cache_dir / "key.json").stat().st_mode & 0o777 == 0o644
+    
+    (cache_dir / "corrupt.json").write_text("{not json")
+    assert _load_cached_review("corrupt") is None
+    
+    # A cache directory that can't be created never fails the review
+    blocker = tmp_path / "blocker"
+    blocker.write_text("")
+    configure(PR_REVIEW_CACHE_DIR=blocker / "cache")
+    _store_cached_review("key", result)
+    assert _load_cached_review("key") is None
+
+
+def test_main_reviews_once_then_serves_disk_cache(configure, fake_provider_class, tmp_path, monkeypatch):
+    """A re-run on the same diff is answered from the disk cache."""
+    from src import main
+    from src.providers import azure_openai_provider
+    
+    created = []
+    
+    class Provider(fake_provider_class):
+        def __init__(self):
+            super().__init__()
+            created.append(self)
+    
+    monkeypatch.setattr(azure_openai_provider, "AzureOpenAIProvider", Provider)
+    output_file = tmp_path / "github_output"
+    configure(PR_REVIEW_CACHE_DIR=tmp_path / "cache", GITHUB_OUTPUT=output_file)
+    
+    asyncio.run(main.main())
+    first = _parse_github_output(output_file.read_text())
+    
+    output_file.write_text("")
+    asyncio.run(main.main())
+    second = _parse_github_output(output_file.read_text())
+    
+    assert len(created) == 1
+    assert len(created[0].calls) == 1
+    assert first == second
+    assert first["summary"] == "Looks good"
@@ -1,110 +0,0 @@
-"""
-Simplified test to validate core functionality without import issues.
-"""
-
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
-
-def test_basic_models():
-    """Test basic model functionality."""
-    try:
-        from models.pr_data import PullRequestData, FileChange
-        from models.review_result import ReviewResult, ReviewComment, ReviewSeverity
-        
-        # Test FileChange
-        file_change = FileChange(
-            filename="test.py",
-            status="modified",
-            additions=10,
-            deletions=2
-        )
-        print(f"✅ FileChange created: {file_change.filename}")
-        
-        # Test PullRequestData
-        pr_data = PullRequestData(
-            number=123,
-            title="Test PR",
-            body="Test description",
-            author="test_user",
-            base_branch="main",
-            head_branch="feature",
-            files_changed=[file_change]
-        )
-        
-        # Test methods
-        total_changes = pr_data.get_total_changes()
-        extensions = pr_data.get_file_extensions()
-        print(f"✅ PR Data: {total_changes} changes, extensions: {extensions}")
-        
-        # Test ReviewResult
-        comment = ReviewComment(
-            filename="test.py",
-            line_number=10,
-            message="Good code!",
-            severity=ReviewSeverity.INFO
-        )
-        
-        result = ReviewResult(
-            summary="Looks good",
-            comments=[comment],
-            overall_score=8,
-            approved=True
-        )
-        
-        print(f"✅ Review Result: Score {result.overall_score}, {len(result.comments)} comments")
-        return True
-        
-    except Exception as e:
-        print(f"❌ Error testing models: {e}")
-        return False
-
-def test_logger():
-    """Test logger utility."""
-    try:
-        from utils.logger import get_logger
-        
-        logger = get_logger("test")
-        logger.info("Test log message")
-        print("✅ Logger working correctly")
-        return True
-        
-    except Exception as e:
-        print(f"❌ Error testing logger: {e}")
-        return False
-
-def test_interfaces():
-    """Test interface definitions."""
-    try:
-        from interfaces.ai_provider import AIProvider, AIProviderError
-        
-        # Test exception
-        error = AIProviderError("Test error", "test_provider")
-        print(f"✅ AIProviderError: {error}")
-        return True
-        
-    except Exception as e:
-        print(f"❌ Error testing interfaces: {e}")
-        return False
-
-if __name__ == "__main__":
-    print("🚀 Testing Azure OpenAI PR Review Agent Structure...")
-    print("=" * 50)
-    
-    success = True
-    success &= test_basic_models()
-    success &= test_logger()
-    success &= test_interfaces()
-    
-    print("=" * 50)
-    if success:
-        print("🎉 All core tests passed! Project structure is correct.")
-        print("\n📋 Project Summary:")
-        print("• ✅ Modular architecture following SOLID principles")
-        print("• ✅ Separation of concerns with clear interfaces")
-        print("• ✅ Immutable data models")
-        print("• ✅ Extensible design for future AI providers")
-        print("• ✅ Ready for GitHub Actions deployment")
-    else:
-        print("❌ Some tests failed.")
-        sys.exit(1)